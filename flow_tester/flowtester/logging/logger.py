@@ -279,6 +279,12 @@ class Logger:
 
         :return: None
         """
+        # Skip the stack inspection when the level would not be logged
+        # (EXCEPTION is logged at ERROR level).
+        if not self.logger.isEnabledFor(
+                self.STR_TO_VAL.get(level.lower(), self.ERROR)):
+            return
+
         log_routine = getattr(self.logger, level.lower())
         log_routine(str(prefix) + str(msg), extra=self._method())
 
@@ -436,6 +442,17 @@ class Logger:
         """
         self._log_level(level='EXCEPTION', msg=msg)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Shortcut to logging.isEnabledFor() call: used to skip building
+        expensive messages that would not be logged.
+        :param level: logging.LEVEL (e.g. - Logger.DEBUG)
+
+        :return: (bool) True = messages at the given level are logged
+
+        """
+        return self.logger.isEnabledFor(level)
+
 
 # FOR VISUAL/MANUAL TESTING PURPOSES
 #   - Need to be executed explicitly.
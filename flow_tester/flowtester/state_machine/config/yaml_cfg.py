@@ -1,49 +1,224 @@
 
+import copy
+import mmap
 import os
+import pickle
+import tempfile
 import traceback
 import typing
+from collections import OrderedDict
 
 import yaml
-from yaml.parser import ParserError
 
 from flowtester.logging.logger import Logger
 
+# Use the libyaml (C) loader when PyYAML was built with it; it is
+# considerably faster than the pure python loader.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 
 logging = Logger()
 
+# Parsed YAML files, keyed by absolute path: (mtime_ns, size, parsed data).
+# A file is only re-parsed if its modification time or size has changed.
+# Least recently used entries are evicted once MAX_CACHED_FILES is exceeded.
+# Each read returns a deep copy of the cached data, which is still about an
+# order of magnitude faster than parsing the file again (even with libyaml).
+MAX_CACHED_FILES = 100
+_parsed_files: "OrderedDict[str, typing.Tuple[int, int, typing.Any]]" = \
+    OrderedDict()
+
+
+def clear_cache() -> None:
+    """
+    Remove all parsed files from the cache, so the next read of each file
+    parses it again (or reads its cache file, if enabled).
+
+    Returns:
+        None
+
+    """
+    _parsed_files.clear()
+
 
 class YamlInputFile:
-    def __init__(self, input_file):
+
+    # Suffix added to the input file name for the parsed data cache file
+    CACHE_FILE_SUFFIX = '.pkl'
+
+    def __init__(self, input_file, cache_file: bool = False):
+        """
+        Args:
+            input_file (str): YAML file to read
+            cache_file (bool): Store the parsed data in a cache file next to
+                the YAML file (<input_file>.pkl), and read the data from the
+                cache file (rather than parsing the YAML) while the YAML file
+                is unchanged.
+                WARNING: the cache file is unpickled, and unpickling can run
+                arbitrary code. Only enable it when the cache file is trusted,
+                i.e. nobody else can write to the YAML file's directory.
+        """
         self.input_file = input_file
+        self.cache_file = (f"{input_file}{self.CACHE_FILE_SUFFIX}"
+                           if cache_file else None)
         self.data = self.read_file()
 
     def read_file(self) -> typing.Dict:
         """
-        Read contents of YAML file from disk.
+        Read contents of YAML file from disk. The parsed contents are cached
+        (see MAX_CACHED_FILES), and each call returns its own copy of the data,
+        so callers may modify the data freely.
 
         Returns:
             (dict) - Nested dictionary of data from file
-                   - Empty dict if unable to read YAML from file
+                   - Empty dict if unable to read YAML from file (or the
+                     file is empty)
         """
         data = {}
         if self.does_input_file_exist():
-            with open(self.input_file, "r") as input_file:
-                try:
-                    data = yaml.safe_load(input_file)
-                except yaml.parser.ParserError:
-                    logging.error("Malformed YAML file.")
-                    logging.error(traceback.format_exc())
+            with open(self.input_file, "rb") as input_file:
+                stats = os.fstat(input_file.fileno())
+
+                # An empty file has no data (and cannot be memory mapped)
+                if stats.st_size == 0:
+                    logging.warning(f"Warning: '{self.input_file}' is empty.")
+                    return data
+
+                # Return the previously parsed data if the file is unchanged
+                cache_key = os.path.abspath(self.input_file)
+                cached = _parsed_files.get(cache_key)
+                if (cached is not None and
+                        cached[:2] == (stats.st_mtime_ns, stats.st_size)):
+                    _parsed_files.move_to_end(cache_key)
+                    return copy.deepcopy(cached[2])
+
+                # Use the cache file's data if it was built from this version
+                # of the file
+                file_version = (stats.st_mtime_ns, stats.st_size)
+                data = self._read_cache_file(file_version=file_version)
+                if data is not None:
+                    self._cache_data(cache_key, file_version, data)
+                    return data
+
+                # Map the file read-only and let the parser stream from the
+                # mapping, rather than reading the file into a python str.
+                with mmap.mmap(input_file.fileno(), 0,
+                               access=mmap.ACCESS_READ) as buffer:
+                    try:
+                        data = yaml.load(buffer, Loader=SafeLoader)
+                    except yaml.YAMLError:
+                        logging.error("Malformed YAML file.")
+                        logging.error(traceback.format_exc())
+                        return {}
+
+                self._cache_data(cache_key, file_version, data)
+                self._write_cache_file(file_version=file_version, data=data)
         else:
             logging.error(f"Error: '{self.input_file}' was not found.")
 
         return data
 
+    @staticmethod
+    def _cache_data(cache_key: str, file_version: typing.Tuple[int, int],
+                    data: typing.Any) -> None:
+        """
+        Cache a copy of the parsed data (evicting the least recently used
+        file if the cache is full)
+
+        Args:
+            cache_key (str): Absolute path of the YAML file
+            file_version (tuple): (mtime_ns, size) of the YAML file
+            data: Parsed data
+
+        Returns:
+            None
+
+        """
+        _parsed_files[cache_key] = (*file_version, copy.deepcopy(data))
+        _parsed_files.move_to_end(cache_key)
+        if len(_parsed_files) > MAX_CACHED_FILES:
+            _parsed_files.popitem(last=False)
+
+    def _read_cache_file(
+            self, file_version: typing.Tuple[int, int]) -> typing.Any:
+        """
+        Read the parsed data from the cache file. The cache file must be
+        trusted (see __init__): it is unpickled.
+
+        Args:
+            file_version (tuple): (mtime_ns, size) of the YAML file
+
+        Returns:
+            Parsed data, or None if there is no cache file (or it is unreadable
+            or was built from a different version of the YAML file)
+
+        """
+        if self.cache_file is None or not os.path.exists(self.cache_file):
+            return None
+
+        try:
+            with open(self.cache_file, "rb") as cache_file:
+                cached_version, data = pickle.load(cache_file)
+            cached_version = tuple(cached_version)
+
+        # A corrupt (or incompatible) pickle can fail in many ways, e.g.
+        # AttributeError or ImportError for unknown classes. The cache file
+        # is only an optimization, so any failure falls back to the YAML.
+        except Exception as exc:
+            logging.debug(f"Unable to read cache file '{self.cache_file}': "
+                          f"{exc}")
+            return None
+
+        return data if cached_version == file_version else None
+
+    def _write_cache_file(
+            self, file_version: typing.Tuple[int, int],
+            data: typing.Any) -> None:
+        """
+        Write the parsed data to the cache file (if enabled). The file is
+        written to a temporary file and then renamed, so a partially written
+        cache file is never read.
+
+        Args:
+            file_version (tuple): (mtime_ns, size) of the YAML file
+            data: Parsed data
+
+        Returns:
+            None
+
+        """
+        if self.cache_file is None:
+            return
+
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+        try:
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, "wb") as cache_file:
+                    pickle.dump((file_version, data), cache_file,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_file, self.cache_file)
+            except BaseException:
+                # Do not let a failed clean up hide the original error
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+                raise
+        except OSError as exc:
+            logging.warn(f"Unable to write cache file '{self.cache_file}': "
+                         f"{exc}")
+
     def does_input_file_exist(self) -> bool:
         """
-        Determine if provided file exists (full path)
+        Determine if provided file exists (full path) and is a regular file
 
         Returns:
-           (bool) True: file/path exists, False: file/path does not exist
+           (bool) True: file exists, False: file does not exist (or is not a
+               file, e.g. a directory)
 
         """
-        return os.path.exists(self.input_file)
+        return os.path.isfile(self.input_file)
@@ -152,7 +152,7 @@ class MachineDefinition:
         """
         transition_list = []
 
-        logging.debug(f"Finding state data for '{state}'")
+        logging.debug(f"Finding state data for '{state}'")
         for state_definition_dict in self.get_state_definitions():
 
             # Get the name and definition of the current state
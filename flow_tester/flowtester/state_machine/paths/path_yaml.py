@@ -13,8 +13,16 @@ logging = Logger()
 
 class StatePathsYaml(YamlInputFile):
 
-    def __init__(self, input_file):
-        super(StatePathsYaml, self).__init__(input_file)
+    def __init__(self, input_file, cache_file: bool = False):
+        """
+        Args:
+            input_file (str): YAML path file to read
+            cache_file (bool): Keep the parsed data in a cache file next to
+                the YAML file (see YamlInputFile; the cache file must be
+                trusted, since it is unpickled). Referenced YAML files are
+                always parsed.
+        """
+        super(StatePathsYaml, self).__init__(input_file, cache_file=cache_file)
         self.test_case = None
 
         # Check if YAML file is a referential file (points to another YAML
@@ -23,6 +31,14 @@ class StatePathsYaml(YamlInputFile):
         # structure built by the YamlInputFile instantiation.
         self.data = ReferentialYAML(self).evaluate_yaml_file()
 
+        # The data is a list of single-key dictionaries (one per test suite).
+        # Index the test suites by name, so suite lookups do not need to scan
+        # the list. The first definition wins if a name is defined twice.
+        self._suites = {}
+        for ts_entry in self.data:
+            for ts_name, ts_data in ts_entry.items():
+                self._suites.setdefault(ts_name, ts_data)
+
     def show_file(self):
         """
         Debug: show the contents of the file in python native data structures
@@ -53,22 +69,38 @@ class StatePathsYaml(YamlInputFile):
             List of test cases for the provided test suite
 
         """
-        test_suites = self.get_test_suites()
-        if test_suite not in test_suites:
+        ts_data = self._get_suite(test_suite)
+        if ts_data is None:
+            return ['']
+
+        test_cases = list(ts_data)
+        logging.debug(f"Test Cases: {test_cases}")
+
+        return test_cases
+
+    def _get_suite(self, test_suite: str) -> typing.Optional[dict]:
+        """ Get the definition of a specific test suite
+
+        Args:
+            test_suite: Test suite to retrieve
+
+        Returns:
+            Dictionary of test case definitions (key = test case name), or
+            None if the test suite is not defined.
+
+        """
+        if test_suite not in self._suites:
             logging.debug(f"ERROR: Test suite '{test_suite}' not in list of "
                           f"known test suites in file '{self.input_file}':"
-                          f" {test_suites} ")
-            return ['']
+                          f" {self.get_test_suites()} ")
+            return None
 
         logging.debug(f"Requested Test Suite: {test_suite}")
 
-        ts_data = [x for x in self.data if test_suite in x][0][test_suite]
+        ts_data = self._suites[test_suite] or {}
         logging.debug(f"Test Suite Definition:\n{pprint.pformat(ts_data)}")
 
-        test_cases = list(ts_data.keys())
-        logging.debug(f"Test Cases: {test_cases}")
-
-        return test_cases
+        return ts_data
 
     def build_test_case(
             self, test_suite: str, test_name: str) -> typing.List[PathStep]:
@@ -84,37 +116,37 @@ class StatePathsYaml(YamlInputFile):
             and validation parameters
 
         """
-        test_cases = self.get_possible_test_cases(test_suite)
+        # Get test suite data, get the test case steps and return list
+        ts_data = self._get_suite(test_suite) or {}
 
         # Check if test case is defined...
-        if test_name not in test_cases:
+        if test_name not in ts_data:
             logging.error(f"The test case '{test_name}' was not found in "
                           f"specified suite: '{test_suite}'")
             return []
 
-        # Get test suite data, get the test case steps and return list
-        ts_data = [x for x in self.data if test_suite in x][0][test_suite]
-
         test_case = []
         for tc in ts_data[test_name].get(YamlPathConsts.STEPS, []):
-            step = PathStep(trigger=list(tc.keys())[0])
+
+            # Each step is a single-key dictionary: {trigger: step definition}
+            trigger, step_def = next(iter(tc.items()))
+            step = PathStep(trigger=trigger)
 
             # Record the trigger's unique id (if present)
-            if YamlPathConsts.ID in tc[step.trigger]:
-                step.add_id(tc[step.trigger][YamlPathConsts.ID])
+            step_id = step_def.get(YamlPathConsts.ID)
+            if step_id is not None:
+                step.add_id(step_id)
 
             # Save validation expectations (id corresponds to specific
             # validation routine associated with step and result is the
             # expectation)
-            if tc[step.trigger][YamlPathConsts.EXPECTATIONS] is not None:
-                for v_id, exp in \
-                        tc[step.trigger][YamlPathConsts.EXPECTATIONS].items():
+            expectations = step_def.get(YamlPathConsts.EXPECTATIONS)
+            if expectations:
+                for v_id, exp in expectations.items():
                     step.add_expectation(v_id, exp)
 
-            # Save the data to passed to the trigger if provided
-            if (tc[step.trigger][YamlPathConsts.DATA] is not None or
-                    tc[step.trigger][YamlPathConsts.DATA] != {}):
-                step.add_data(tc[step.trigger][YamlPathConsts.DATA])
+            # Save the data to passed to the trigger (None if not provided)
+            step.add_data(step_def.get(YamlPathConsts.DATA))
 
             test_case.append(step)
 
@@ -1,5 +1,3 @@
-from collections import namedtuple
-from copy import deepcopy
 import os
 import pprint
 import typing
@@ -38,6 +36,20 @@ class MissingIdLandmark(Exception):
     pass
 
 
+# ==============================================
+#    DATA STRUCTURES
+# ==============================================
+class CfgFileRef(typing.NamedTuple):
+    """
+    Reference from a target test case to a test case in another YAML file.
+    """
+    target_test_suite: str
+    target_test_case: str
+    reference_file: str
+    reference_test_suite: str
+    reference_test_case: str
+
+
 # ==============================================
 #    PRIMARY CLASS FOR MODULE
 # ==============================================
@@ -70,22 +82,23 @@ class ReferentialYAML:
     """
 
     DELIMITER = ":"
-    REFERENCE_DATA = namedtuple(
-        'CfgFileRef',
-        'target_test_suite '
-        'target_test_case '
-        'reference_file '
-        'reference_test_suite '
-        'reference_test_case')
+    REFERENCE_DATA = CfgFileRef
 
     def __init__(self, yaml_input: YamlInputFile):
         self.yaml = yaml_input
-        self.cfg_file_path = os.path.sep.join(
-            self.yaml.input_file.split(os.path.sep)[:-1])
+        self.cfg_file_path = os.path.dirname(self.yaml.input_file)
         self.input_file = self.yaml.input_file
         self.data = self.yaml.data
         self.references = list()
 
+        # Parsed referenced files, keyed by real path (a file is only read
+        # once, regardless of the number of references to it)
+        self._ref_file_cache: typing.Dict[str, YamlInputFile] = {}
+
+        # Test suites of each parsed referenced file (same key as above),
+        # mapped by test suite name: {ts_name: {tc_name: tc_data}}
+        self._ref_ts_cache: typing.Dict[str, dict] = {}
+
     def evaluate_yaml_file(self) -> typing.List[dict]:
         """
         Check if input YAML file references another YAML file. Is so,
@@ -105,7 +118,8 @@ class ReferentialYAML:
             self.modify_steps()
             self.delete_steps()
 
-            logging.debug(f"UPDATED:\n{pprint.pformat(self.yaml.data)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"UPDATED:\n{pprint.pformat(self.yaml.data)}")
 
         return self.data
 
@@ -125,11 +139,17 @@ class ReferentialYAML:
         for test_suite_data in self.data:
 
             # Get test suite name & data
-            test_suite = list(test_suite_data.keys())[0]
+            test_suite = next(iter(test_suite_data))
             test_case_data = test_suite_data[test_suite]
 
-            logging.debug(f"Data:\n{test_suite_data}")
-            logging.debug(f"TS: {test_suite}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"Data:\n{test_suite_data}")
+                logging.debug(f"TS: {test_suite}")
+
+            # Skip suites where no test case has a reference key
+            if not any(SMConsts.REFERENCE in tc_data
+                       for tc_data in test_case_data.values()):
+                continue
 
             # Iterate through each test case and check for a reference key
             for test_case, tc_data in test_case_data.items():
@@ -137,7 +157,7 @@ class ReferentialYAML:
                 logging.debug(f"TC: {test_case}")
 
                 # Check for reference key
-                reference_found = SMConsts.REFERENCE in tc_data.keys()
+                reference_found = SMConsts.REFERENCE in tc_data
 
                 # If found, parse and store in NamedTuple and append to list
                 # of references
@@ -162,12 +182,11 @@ class ReferentialYAML:
                         logging.error(msg)
                         raise ReferenceParseError(msg)
 
-                    self.references.append(self.REFERENCE_DATA(
-                        target_test_suite=test_suite,
-                        target_test_case=test_case,
-                        reference_file=ref_file,
-                        reference_test_suite=ref_ts,
-                        reference_test_case=ref_tc))
+                    # Positional: (target_test_suite, target_test_case,
+                    # reference_file, reference_test_suite,
+                    # reference_test_case)
+                    self.references.append(CfgFileRef(
+                        test_suite, test_case, ref_file, ref_ts, ref_tc))
 
                 # Tally result
                 references_found = references_found or reference_found
@@ -183,13 +202,18 @@ class ReferentialYAML:
         Returns: None
 
         """
+        # Constants used within the loops (bound locally to avoid repeated
+        # attribute lookups)
+        id_key = YamlConsts.ID
+        after_id = YamlConsts.AFTER_ID
+        landmarks = (YamlConsts.BEFORE_ID, after_id)
+
+        ts_index = self._ts_index()
         for ref in self.references:
             logging.debug(f"Processing TS: {ref.target_test_suite}  "
                           f"TC: {ref.target_test_case}")
 
-            ts = [ts_data for ts_name, ts_data in self.yaml.data[0].items()
-                  if ts_name == ref.target_test_suite]
-            tc = ts[0][ref.target_test_case]
+            tc = ts_index[ref.target_test_suite][ref.target_test_case]
 
             # Get the steps to be added.
             # --------------------------------
@@ -200,23 +224,29 @@ class ReferentialYAML:
             # add_steps will be None so reset add_steps to []
             add_steps = add_steps or []
 
-            # Verify all steps to be added are not defined in the reference path
-            # if this is not the case, _verify_add_ids_do_not_exist() will
-            # throw an exception.
-            add_step_ids = [y.get(YamlConsts.ID) for x in add_steps for y
-                            in x.values()]
-
-            # Get all IDs associated with the landmark (BEFORE_ID/AFTER_ID)
-            landmark_ids = []
-            for landmark in [YamlConsts.BEFORE_ID, YamlConsts.AFTER_ID]:
-                landmark_ids += [y.get(landmark) for x in add_steps for y
-                                 in x.values() if landmark in y]
-            landmark_ids = list(set(landmark_ids))
+            # Collect (in a single pass):
+            #   * the IDs of the steps to be added. Verify all steps to be
+            #     added are not defined in the reference path; if this is not
+            #     the case, _verify_add_ids_do_not_exist() will throw an
+            #     exception.
+            #   * the unique IDs associated with the landmarks
+            #     (BEFORE_ID/AFTER_ID)
+            add_step_ids = []
+            landmark_ids = set()
+            for add_step in add_steps:
+                for step_def in add_step.values():
+                    add_step_ids.append(str(step_def.get(id_key)))
+                    for landmark in landmarks:
+                        if landmark in step_def:
+                            landmark_ids.add(str(step_def[landmark]))
 
             # Log all calculated/collected data
-            logging.debug(f"ADD STEPS:\n{pprint.pformat(add_steps)}")
-            logging.debug(f"STEP IDs TO BE ADDED: {', '.join(add_step_ids)}")
-            logging.debug(f"UNIQUE LANDMARK IDs: {', '.join(landmark_ids)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"ADD STEPS:\n{pprint.pformat(add_steps)}")
+                logging.debug(f"STEP IDs TO BE ADDED: "
+                              f"{', '.join(add_step_ids)}")
+                logging.debug(f"UNIQUE LANDMARK IDs: "
+                              f"{', '.join(landmark_ids)}")
 
             # Get the current mapping
             mapping = self._build_id_map(tc_def_dict=tc)
@@ -228,20 +258,21 @@ class ReferentialYAML:
 
             # Verify Landmark IDs + "IDs to be added" used as reference points
             # exist
-            possible_ids = list(mapping.keys())
-            possible_ids.extend(add_step_ids)
+            possible_ids = set(mapping)
+            possible_ids.update(add_step_ids)
             self._verify_target_ids_exist(
                 ts=ref.target_test_suite, tc=ref.target_test_case,
                 mappings=possible_ids, target_ids=landmark_ids)
 
             # Insert the new steps
+            steps = tc[YamlConsts.STEPS]
             for target_step in add_steps:
 
                 # Get a list of the ids to list index mapping
                 logging.debug(f"Target Step Definition to be added:\n"
                               f"{target_step}")
-                target_step_name = list(target_step.keys())[0]
-                target_step_data = list(target_step.values())[0]
+                target_step_name, target_step_data = next(
+                    iter(target_step.items()))
 
                 # Get target landmark (before/after) and step id
                 landmark, target_id = self._get_target_landmark(
@@ -251,23 +282,28 @@ class ReferentialYAML:
                 # Get the landmarked step's index and increment to get
                 # targeted list index
                 target_id_index = mapping[str(target_id)]
-                if landmark == YamlConsts.AFTER_ID:
+                if landmark == after_id:
                     target_id_index += 1
 
-                # Copy the step definition to be inserted, and
-                # delete the landmark key from the definition.
-                step_def = deepcopy(target_step_data)
-                del step_def[landmark]
+                # Copy the step definition to be inserted, minus the landmark
+                # key. Only the top level dictionary is changed, so the nested
+                # definitions (data, expectations) are shared, not copied.
+                step_def = {key: value for key, value in
+                            target_step_data.items() if key != landmark}
 
                 # Insert the step into the list at the target index
-                tc[YamlConsts.STEPS].insert(
-                    target_id_index, {target_step_name: step_def})
+                steps.insert(target_id_index, {target_step_name: step_def})
 
-                # Regenerate the index dictionary based on the latest update
-                mapping = self._build_id_map(tc_def_dict=tc)
+                # Update the index dictionary based on the latest update:
+                # steps at or after the insertion point move down by one.
+                for step_id, index in mapping.items():
+                    if index >= target_id_index:
+                        mapping[step_id] = index + 1
+                mapping[str(target_step_data[id_key])] = target_id_index
 
             # Log results of operation
-            logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
 
     def delete_steps(self):
         """
@@ -278,26 +314,22 @@ class ReferentialYAML:
         Returns: None
 
         """
+        ts_index = self._ts_index()
         for ref in self.references:
             logging.debug(f"Processing TS: {ref.target_test_suite}  "
                           f"TC: {ref.target_test_case}")
 
             # Get the test case and test step information
-            ts = [ts_data for ts_name, ts_data in self.yaml.data[0].items()
-                  if ts_name == ref.target_test_suite]
-            tc = ts[0][ref.target_test_case]
+            tc = ts_index[ref.target_test_suite][ref.target_test_case]
 
             # Get a list of the ids to list index mapping
             mapping = self._build_id_map(tc_def_dict=tc)
 
-            # Get the list of UNIQUE steps to be deleted.
-            # --------------------------------------------
-            # If the key is not defined, return an empty list.
-            del_steps = list(set(tc.get(YamlConsts.DEL_STEPS, [])))
-
-            # If the key is defined, but no value is set, del_steps will be
-            # None, so reset to []
-            del_steps = del_steps or []
+            # Get the set of UNIQUE steps to be deleted.
+            # -------------------------------------------
+            # If the key is not defined, or is defined but no value is set,
+            # use an empty set.
+            del_steps = set(tc.get(YamlConsts.DEL_STEPS) or [])
 
             # Verify all steps to be deleted are defined in the reference path
             # if this is not the case, _verify_del_id_exist will throw an
@@ -309,7 +341,7 @@ class ReferentialYAML:
             # Get the index order in reverse order, so each step can be
             # deleted without impacting the index of the other elements
             # to be deleted
-            to_delete_list = sorted([mapping[id_] for id_ in del_steps],
+            to_delete_list = sorted((mapping[id_] for id_ in del_steps),
                                     reverse=True)
             logging.debug(f"Indices to delete: {to_delete_list}")
 
@@ -320,7 +352,8 @@ class ReferentialYAML:
                 logging.debug(f"Removed item {target_index}:\n{item}")
 
             # Log results of operation
-            logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
 
     def modify_steps(self):
         """
@@ -332,13 +365,15 @@ class ReferentialYAML:
             None
 
         """
+        # Bound locally to avoid repeated attribute lookups within the loops
+        id_key = YamlConsts.ID
+
+        ts_index = self._ts_index()
         for ref in self.references:
             logging.debug(f"Processing TS: {ref.target_test_suite}  "
                           f"TC: {ref.target_test_case}")
 
-            ts = [ts_data for ts_name, ts_data in self.yaml.data[0].items()
-                  if ts_name == ref.target_test_suite]
-            tc = ts[0][ref.target_test_case]
+            tc = ts_index[ref.target_test_suite][ref.target_test_case]
 
             # Get the steps to be updated.
             # --------------------------------
@@ -351,12 +386,14 @@ class ReferentialYAML:
 
             # Verify all steps to be modified are defined in the
             # reference path
-            mod_step_ids = [str(y.get(YamlConsts.ID)) for x in mod_steps for y
+            mod_step_ids = [str(y.get(id_key)) for x in mod_steps for y
                             in x.values()]
 
             # Log all calculated/collected data
-            logging.debug(f"MODIFY STEPS:\n{pprint.pformat(mod_steps)}")
-            logging.debug(f"STEP IDs TO BE ADDED: {', '.join(mod_step_ids)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"MODIFY STEPS:\n{pprint.pformat(mod_steps)}")
+                logging.debug(f"STEP IDs TO BE ADDED: "
+                              f"{', '.join(mod_step_ids)}")
 
             # Get the current mapping
             mapping = self._build_id_map(tc_def_dict=tc)
@@ -364,24 +401,27 @@ class ReferentialYAML:
             # Verify Landmark IDs to be used as reference points do exist
             self._verify_target_ids_exist(
                 ts=ref.target_test_suite, tc=ref.target_test_case,
-                mappings=list(mapping.keys()),
-                target_ids=mod_step_ids)
+                mappings=set(mapping), target_ids=mod_step_ids)
 
             # Insert the new steps
+            steps = tc[YamlConsts.STEPS]
             for target_step in mod_steps:
 
                 # Get a list of the ids to list index mapping
-                logging.debug(f"Target Step Definition to be modified:"
-                              f"\n{pprint.pformat(target_step)}")
-                target_step_data = list(target_step.values())[0]
-                target_id = str(target_step_data.get(YamlConsts.ID))
+                if logging.is_enabled_for(logging.DEBUG):
+                    logging.debug(f"Target Step Definition to be modified:"
+                                  f"\n{pprint.pformat(target_step)}")
+                target_step_data = next(iter(target_step.values()))
+                target_id = str(target_step_data.get(id_key))
 
                 # Get the target step's index
                 target_id_index = mapping.get(target_id)
 
-                # Copy the step definition to be inserted, and
-                # delete the landmark key.
-                step_def = deepcopy(target_step_data)
+                # Insert a copy of the step definition, so the test case and
+                # the MOD_STEPS definition do not share the same dictionary.
+                # Only the top level is copied: the nested definitions (data,
+                # expectations) are never altered.
+                step_def = dict(target_step_data)
 
                 valid, trigger_name = self._validate_trigger_names_match(
                     ts=ref.target_test_suite, tc=ref.target_test_case,
@@ -393,11 +433,11 @@ class ReferentialYAML:
                                  f"(list index: {target_id_index})")
 
                 # Insert the step into the list
-                tc[YamlConsts.STEPS][target_id_index].update(
-                    {trigger_name: step_def})
+                steps[target_id_index].update({trigger_name: step_def})
 
             # Log results of operation
-            logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"Updated Test Case:\n{pprint.pformat(tc)}")
 
     def add_referenced_tc_to_ts(
             self, target_ts: str, target_tc: str, tc_data: dict):
@@ -438,6 +478,17 @@ class ReferentialYAML:
     #    DATA RETRIEVAL ROUTINES
     # ==============================================
 
+    def _ts_index(self) -> dict:
+        """
+        Map each test suite name to its definition in the current YAML data.
+
+        Returns:
+            (dict) test_suite_name: test_suite_data
+
+        """
+        return {ts_name: ts_data for ts_entry in self.yaml.data
+                for ts_name, ts_data in ts_entry.items()}
+
     @staticmethod
     def _build_id_map(tc_def_dict: dict) -> dict:
         """
@@ -456,17 +507,19 @@ class ReferentialYAML:
         steps = tc_def_dict[YamlConsts.STEPS]
 
         # Store the step id and the element index
+        id_key = YamlConsts.ID
         for index, step_def_dict in enumerate(steps):
-            step_id = str(list(step_def_dict.values())[0][YamlConsts.ID])
+            step_id = str(next(iter(step_def_dict.values()))[id_key])
             id_to_step_mapping[step_id] = index
 
-        logging.debug(pprint.pformat(id_to_step_mapping))
+        if logging.is_enabled_for(logging.DEBUG):
+            logging.debug(pprint.pformat(id_to_step_mapping))
 
         return id_to_step_mapping
 
     @staticmethod
     def _get_target_landmark(
-            tc_name: str, tc_data: dict, tc_ref: REFERENCE_DATA) -> tuple:
+            tc_name: str, tc_data: dict, tc_ref: CfgFileRef) -> tuple:
         """
         Parse the testcase data to determine the landmark (previous, next) and
         the id to use with the landmark.
@@ -528,17 +581,49 @@ class ReferentialYAML:
             ref_tc = ref.reference_test_case
 
             # Get referenced YAML config file
-            referenced_file = os.path.sep.join(
-                [self.cfg_file_path, ref.reference_file])
-
-            reference_data = YamlInputFile(referenced_file)
-            logging.debug(f"RAW DATA:\n{pprint.pformat(reference_data.data)}")
-
-            tc_data = self.get_referenced_test_data(
-                yaml_input=reference_data, testsuite=ref_ts, testcase=ref_tc)
-            logging.debug(f"Testcase data for TS: '{ref_ts}' TC: '{ref_tc}' "
-                          f"in FILE: '{referenced_file}'"
-                          f"\n{pprint.pformat(tc_data)}")
+            referenced_file = os.path.join(
+                self.cfg_file_path, ref.reference_file)
+
+            cache_key = os.path.realpath(referenced_file)
+            reference_data = self._ref_file_cache.get(cache_key)
+            if reference_data is None:
+                reference_data = YamlInputFile(referenced_file)
+                self._ref_file_cache[cache_key] = reference_data
+                self._ref_ts_cache[cache_key] = {
+                    ts_name: ts_data for ts_entry in reference_data.data
+                    for ts_name, ts_data in ts_entry.items()}
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(
+                    f"RAW DATA:\n{pprint.pformat(reference_data.data)}")
+
+            # Look up the test case directly; fall back to the full search
+            # (which reports the missing test suite/case) if it is not found.
+            ts_data = self._ref_ts_cache[cache_key].get(ref_ts) or {}
+            tc_data = ts_data.get(ref_tc)
+            if not tc_data:
+                tc_data = self.get_referenced_test_data(
+                    yaml_input=reference_data, testsuite=ref_ts,
+                    testcase=ref_tc)
+            if logging.is_enabled_for(logging.DEBUG):
+                logging.debug(f"Testcase data for TS: '{ref_ts}' "
+                              f"TC: '{ref_tc}' in FILE: '{referenced_file}'"
+                              f"\n{pprint.pformat(tc_data)}")
+
+            # The referenced file's data is shared by every reference to the
+            # file, but the list of steps (and each step dictionary) is
+            # updated in place when adding, modifying, and deleting steps, so
+            # each reference gets its own copy of the steps. The step
+            # definitions are copied too (top level only), so changing a
+            # step of one test case never changes another test case or the
+            # referenced file's data.
+            steps = tc_data.get(YamlConsts.STEPS)
+            if steps:
+                tc_data = dict(tc_data)
+                tc_data[YamlConsts.STEPS] = [
+                    {trigger: (dict(step_def) if isinstance(step_def, dict)
+                               else step_def)
+                     for trigger, step_def in step.items()}
+                    for step in steps]
 
             self.add_referenced_tc_to_ts(target_ts, target_tc, tc_data)
 
@@ -564,8 +649,9 @@ class ReferentialYAML:
         # Iterate through read-in file searching for testsuite/testcase.
         target_ts_data = {}
         for test_suite_data in yaml_input.data:
-            if testsuite in test_suite_data.keys():
-                target_ts_data = test_suite_data.get(testsuite, {})
+            if testsuite in test_suite_data:
+                target_ts_data = test_suite_data[testsuite] or {}
+                break
 
         # Didn't find the requested testsuite.
         if not target_ts_data:
@@ -631,9 +717,10 @@ class ReferentialYAML:
             logging.error(msg)
             raise StepIdExists(msg)
 
-        logging.debug(f"KNOWN IDS: {', '.join([str(x) for x in known_ids])}")
-        logging.debug(f"TO ADD: "
-                      f"{', '.join([str(x) for x in ids_to_be_added_set])}")
+        if logging.is_enabled_for(logging.DEBUG):
+            logging.debug(f"KNOWN IDS: {', '.join(map(str, known_ids))}")
+            logging.debug(f"TO ADD: "
+                          f"{', '.join(ids_to_be_added_set)}")
 
         # Find the intersection and compare to the list to be added.
         # The lists should be unique, so there cannot be an intersection.
@@ -672,15 +759,14 @@ class ReferentialYAML:
         known_ids = set(mapping.keys())
         ids_to_be_updated = set(ids_to_be_updated)
 
-        logging.debug(f"KNOWN IDS: {', '.join([str(x) for x in known_ids])}")
-        logging.debug(f"TO MODIFY/DELETE: "
-                      f"{', '.join([str(x) for x in ids_to_be_updated])}")
+        if logging.is_enabled_for(logging.DEBUG):
+            logging.debug(f"KNOWN IDS: {', '.join(map(str, known_ids))}")
+            logging.debug(f"TO MODIFY/DELETE: "
+                          f"{', '.join(map(str, ids_to_be_updated))}")
 
-        # Find the intersection and compare to the list to be updated.
-        # Intersection should match all ids to update. If the intersection is
-        # not the same as the update list, there is an id in the update list
-        # that is not defined in the path.
-        diff = (ids_to_be_updated & known_ids) ^ ids_to_be_updated
+        # Any id in the update list that is not a known id is not defined in
+        # the path.
+        diff = ids_to_be_updated - known_ids
 
         if diff:
             msg = (f"\nCfg File:   {self.yaml.input_file}\n"
@@ -696,14 +782,15 @@ class ReferentialYAML:
         return True
 
     def _verify_target_ids_exist(
-            self, ts: str, tc: str, mappings: list, target_ids: list) -> bool:
+            self, ts: str, tc: str, mappings: set,
+            target_ids: typing.Iterable) -> bool:
         """
         Verify all landmark IDs are defined in the reference model.
         Args:
             ts (str): Test suite name
             tc (str): Test case name
-            mappings (list): List of all defined ids
-            target_ids (list): List of all IDs to be used as landmarks
+            mappings (set): Set of all defined ids
+            target_ids (iterable): All IDs to be used as landmarks
 
         Returns: True if all ids are known (defined)
 
@@ -712,17 +799,16 @@ class ReferentialYAML:
             testcase (path)
 
         """
-        # Convert lists to sets of strings for qualitative comparison
-        known_ids_set = set([str(x) for x in mappings])
-        target_ids_set = set([str(x) for x in target_ids])
+        # Ids are already strings, so no conversion is needed.
+        target_ids_set = set(target_ids)
 
-        logging.debug(f"KNOWN IDS: "
-                      f"{', '.join([str(x) for x in known_ids_set])}")
-        logging.debug(f"VALIDATING EXISTENCE: "
-                      f"{', '.join([str(x) for x in target_ids_set])}")
+        if logging.is_enabled_for(logging.DEBUG):
+            logging.debug(f"KNOWN IDS: {', '.join(mappings)}")
+            logging.debug(f"VALIDATING EXISTENCE: "
+                          f"{', '.join(target_ids_set)}")
 
         # Are there any target ids that are not in the known ids?
-        diff = target_ids_set.difference(known_ids_set)
+        diff = target_ids_set.difference(mappings)
 
         if diff:
             msg = (f"\nCfg File:   {self.yaml.input_file}\n"
@@ -755,12 +841,12 @@ class ReferentialYAML:
         """
         # Get the modified definition's trigger name
 
-        target_trigger_name = list(mod_data.keys())[0]
+        target_trigger_name = next(iter(mod_data))
 
         target_id = str(mod_data[target_trigger_name][YamlConsts.ID])
         step_index = mapping[target_id]
-        reference_tc_name = list(
-            reference_tc[YamlConsts.STEPS][step_index].keys())[0]
+        reference_tc_name = next(
+            iter(reference_tc[YamlConsts.STEPS][step_index]))
 
         if target_trigger_name != reference_tc_name:
             msg = (f"\n\tTarget Trigger does not match the defined "
@@ -20,21 +20,17 @@ class ValidatePaths:
             Boolean result: False = validation error
 
         """
-        result = None
         if step.id is None:
             logging.warn(f"Step '{step.trigger}' "
                          f"does not have an ID defined.")
-            result = False
+            return False
 
         if not step.expectations:
             logging.debug(f"Step '{step.trigger}' "
                           f"does not have any expectations.")
 
         # No errors found
-        if result is None:
-            result = True
-
-        return result
+        return True
 
     @classmethod
     def validate_steps(cls, steps: typing.List[PathStep]) -> bool:
@@ -47,42 +43,38 @@ class ValidatePaths:
             boolean: False = issues found in the list of steps
 
         """
-        logging.debug(f"Validating the provided steps: "
-                      f"{', '.join([s.trigger for s in steps])}")
+        result = True
 
-        # If all steps are unique, the length of the id list and
-        # the length of the set of ids should be equal.
-        ids = [step.id for step in steps]
-        result = len(set(ids)) == len(ids)
+        # Map of step id to the index of the first step using that id
+        seen = {}
 
-        id_list = []
         # Validate each step and the ids
         for num, step in enumerate(steps):
 
             # Make sure step is valid and correctly defined
             result = result & cls.validate_step(step)
 
-            # Check for uniqueness
-            try:
-                matching_id = id_list.index(step.id)
-
-            # Not found in the list
-            except ValueError:
-                pass
-
-            # Found in the list (Reporting the index is incremented by 1
-            # since indexing starts at 0)
-            else:
+            # Check for uniqueness: records the step's index if the id has not
+            # been seen; otherwise returns the index of the earlier step.
+            # (Reporting the index is incremented by 1 since indexing starts
+            # at 0)
+            matching_id = seen.setdefault(step.id, num)
+            if matching_id != num:
+                result = False
                 match = steps[matching_id].trigger
                 logging.error(f"Step #{num + 1}'s ID (Trigger: {step.trigger}, "
                               f"ID: '{step.id}') is not unique.")
                 logging.error(f"Step #{matching_id + 1} has the same id. "
                               f"(Trigger: {match}, ID: '{step.id}')")
 
-            id_list.append(step.id)
-
-        if not result:
-            logging.error(f"The requested trigger/test path: "
-                          f"{', '.join([f'{x.trigger} ({x.id})' for x in steps])} ")
+        # Describe the path (only built if it will be logged)
+        debug = logging.is_enabled_for(logging.DEBUG)
+        report_error = not result and logging.is_enabled_for(logging.ERROR)
+        if debug or report_error:
+            path = ', '.join([f'{x.trigger} ({x.id})' for x in steps])
+            if debug:
+                logging.debug(f"Validated the provided steps: {path}")
+            if report_error:
+                logging.error(f"The requested trigger/test path: {path} ")
 
         return result
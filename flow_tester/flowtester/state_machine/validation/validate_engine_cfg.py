@@ -7,6 +7,9 @@ from flowtester.state_machine.config.constants \
 
 logging = Logger()
 
+# Sentinel: distinguishes "not cached" from a cached None value
+_MISSING = object()
+
 
 class BadMultiTriggerDefinition(Exception):
     pass
@@ -16,7 +19,11 @@ class ValidateData:
     def __init__(self, model_data):
         self.model_data = model_data
 
-    VALID_MULTISOURCE_WILDCARDS = ['*', '=']
+        # Transitions per state (from model_data.get_transitions()), cached
+        # so states checked by multiple validations are only looked up once
+        self._trans_cache = {}
+
+    VALID_MULTISOURCE_WILDCARDS = frozenset({'*', '='})
 
     def validate_all_transitions(self) -> bool:
         """
@@ -34,9 +41,12 @@ class ValidateData:
         if not states:
             result = False
 
+        # Set of the states for the destination state membership checks
+        known_states = set(states)
+
         # Get list of all transitions for each state
         for state in states:
-            possible_state_changes = self.model_data.get_transitions(state)
+            possible_state_changes = self._transitions(state)
 
             # No transitions, so move to the next state
             if possible_state_changes is None:
@@ -45,7 +55,7 @@ class ValidateData:
             # Found transitions, check each destination state to known states
             for state_change in possible_state_changes:
                 target_state = state_change[SMConsts.DESTINATION_STATE]
-                if target_state not in states:
+                if target_state not in known_states:
                     logging.error(
                         f"ERROR: {state} has a state change to an undefined "
                         f"state: '{target_state}'")
@@ -79,7 +89,7 @@ class ValidateData:
         # Check if state has transitions defined. If an initial state
         # does not have any transitions, the initial state is also the
         # terminal state and is not a state machine.
-        if not self.model_data.get_transitions(initial_state):
+        if not self._transitions(initial_state):
             logging.error(f"ERROR: Initial state: {initial_state} cannot "
                           f"transition to any downstream paths.")
             result = False
@@ -89,6 +99,23 @@ class ValidateData:
                      f"{result is None}")
         return result is None
 
+    def _transitions(self, state: str) -> typing.Optional[list]:
+        """
+        Get the transitions defined for a state (cached per state).
+
+        Args:
+            state (str): Name of the state
+
+        Returns:
+            List of transitions for the state (None if not defined)
+
+        """
+        transitions = self._trans_cache.get(state, _MISSING)
+        if transitions is _MISSING:
+            transitions = self.model_data.get_transitions(state)
+            self._trans_cache[state] = transitions
+        return transitions
+
     @classmethod
     def validate_multi_trigger_defs(
             cls, list_of_trigger_defs: typing.List[dict],
@@ -111,15 +138,24 @@ class ValidateData:
         """
         errors = list()
 
+        # Set of known states (built once for all trigger definitions)
+        defined_set = set(defined_states)
+
+        # Trigger definition keys (bound locally for use within the loop)
+        name_key = SMConsts.TRIGGER_NAME
+        source_key = SMConsts.SOURCE_STATES
+        routine_key = SMConsts.CHANGE_STATE_ROUTINE
+        destination_key = SMConsts.DESTINATION_STATE
+
         # For each multi-source-state trigger...
         for trigger in list_of_trigger_defs:
 
             # Get the required trigger information
             # ------------------------------------
-            trigger_name = trigger.get(SMConsts.TRIGGER_NAME, None)
-            target_states = trigger.get(SMConsts.SOURCE_STATES, None)
-            callback_routine = trigger.get(SMConsts.CHANGE_STATE_ROUTINE, None)
-            destination_state = trigger.get(SMConsts.DESTINATION_STATE, None)
+            trigger_name = trigger.get(name_key)
+            target_states = trigger.get(source_key)
+            callback_routine = trigger.get(routine_key)
+            destination_state = trigger.get(destination_key)
 
             logging.debug(f"'{trigger_name}' Definition:\n"
                           f"{pprint.pformat(trigger)}")
@@ -127,7 +163,7 @@ class ValidateData:
 
             # Verify the destination state is defined
             # ---------------------------------------
-            if destination_state not in defined_states:
+            if destination_state not in defined_set:
                 msg = (f"ERROR: '{trigger_name}' has a destination state that "
                        f"is not recognized: '{destination_state}'.")
                 logging.error(msg)
@@ -150,7 +186,7 @@ class ValidateData:
             # ------------------------------------
             if isinstance(target_states, list) and target_states:
                 target_states = set(target_states)
-                matches = target_states.intersection(set(defined_states))
+                matches = target_states & defined_set
 
                 logging.debug(f"Target (proposed vs. defined) Intersection:"
                               f" {matches}")
@@ -164,21 +200,21 @@ class ValidateData:
                     errors.append(msg)
 
             # If target states are not a list of states
-            # check for valid wildcards
+            # check for valid wildcards (wildcards are strings; anything else,
+            # e.g. an empty list, is not hashable or not a valid wildcard)
             # -----------------------------------------
-            elif target_states not in cls.VALID_MULTISOURCE_WILDCARDS:
+            elif (not isinstance(target_states, str) or
+                  target_states not in cls.VALID_MULTISOURCE_WILDCARDS):
                 msg = f"Unrecognized wildcard: '{target_states}'"
                 logging.error(msg)
                 errors.append(msg)
 
-            # If everything passes and is valid...
-            # ------------------------------------
-            if not errors:
-                logging.info(
-                    f"No errors found in the '{trigger_name}' multi-source "
-                    f"trigger definition.")
-
         # D'oh!! Stop here if State Machine is not defined correctly
         # -----------------------------------------------------------
         if errors:
             raise BadMultiTriggerDefinition("\n".join(errors))
+
+        # If everything passes and is valid...
+        # ------------------------------------
+        logging.info(f"No errors found in the {len(list_of_trigger_defs)} "
+                     f"multi-source trigger definition(s).")
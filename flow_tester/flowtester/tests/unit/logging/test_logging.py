@@ -7,9 +7,18 @@ from flowtester.logging.logger import Logger, ContextAdapter
 
 from nose.tools import assert_equals, assert_true, assert_false, raises, assert_is_none
 
+# Path of this file without the file extension, split into its parts (the logger
+# reports the caller's file in this form)
+FILE_PATH_PARTS = tuple(__file__.split('.')[0].split(os.path.sep))
+
 
 class TestCommonLogging:
 
+    @classmethod
+    def setup_class(cls):
+        # Shared by the ContextAdapter tests
+        cls.adapter = ContextAdapter(logger=logging.getLogger(), extra={})
+
     def test_context_adapter__translate_to_dotted_lib_path(self):
         self._test__translate_to_dotted_lib_path(logger_class=ContextAdapter)
 
@@ -48,16 +57,13 @@ class TestCommonLogging:
         assert_equals(returned_path, expected_path)
 
     def test_context_adapter__method_without_custom_project_options(self):
-        adapter = ContextAdapter(logger=logging.getLogger(), extra={})
-        self._test_logging_object__method(project='dne', logger_obj=adapter)
+        self._test_logging_object__method(project='dne', logger_obj=self.adapter)
 
     def test_context_adapter__method_with_custom_project_options(self):
-        adapter = ContextAdapter(logger=logging.getLogger(), extra={})
-        self._test_logging_object__method(project='tests', logger_obj=adapter)
+        self._test_logging_object__method(project='tests', logger_obj=self.adapter)
 
     def test_context_adapter__method_with_project_options_set_to_none(self):
-        adapter = ContextAdapter(logger=logging.getLogger(), extra={})
-        self._test_logging_object__method(project=None, logger_obj=adapter)
+        self._test_logging_object__method(project=None, logger_obj=self.adapter)
 
     def test_logger__method_without_custom_project_options(self):
         self._test_logging_object__method(project='dne', logger_obj=Logger())
@@ -90,11 +96,9 @@ class TestCommonLogging:
         if isinstance(logger_obj, ContextAdapter):
 
             # Returned filename will be converted to python path notation without the file extension
-            expected_filename = __file__.split('.')[0]
-
             # If the project is set and matches the path, only the path beyond the project name will
             # be returned.
-            expected_filename_parts = expected_filename.split(os.path.sep)
+            expected_filename_parts = FILE_PATH_PARTS
             if project in expected_filename_parts:
                 index = expected_filename_parts.index(project)
                 expected_filename_parts = expected_filename_parts[index + 1:]
@@ -133,11 +137,18 @@ class TestCommonLogging:
 
 
 class TestLogger:
+
+    @classmethod
+    def setup_class(cls):
+        # Shared by the tests that only use the logger (building a Logger
+        # inspects the call stack)
+        cls.logger = Logger()
+
     def test_basic_logger(self):
         logger = Logger()
 
         # Remove the file extension from the file, and transform into dotted path notation
-        expected_logger_name = ".".join(__file__.split('.')[0].split(os.path.sep))
+        expected_logger_name = ".".join(FILE_PATH_PARTS)
 
         assert_equals(logger.loglevel, Logger.DEFAULT_LOG_LEVEL)
         assert_false(logger.root)
@@ -167,8 +178,7 @@ class TestLogger:
     def test_logging_level_exception(self):
         self._test_logging_level('exception')
 
-    @staticmethod
-    def _test_logging_level(level: str) -> None:
+    def _test_logging_level(self, level: str) -> None:
         """
         Invokes logging method based on level.
 
@@ -179,11 +189,37 @@ class TestLogger:
             None
 
         """
-        logger = Logger()
-        log_method = getattr(logger, level.lower())
+        log_method = getattr(self.logger, level.lower())
         log_method(f"This is a test for logger level {level.upper()}. "
                    f"This should not crash or throw an error.")
 
+    def test_is_enabled_for(self):
+        logger = self.logger
+        effective_level = logger.logger.logger.getEffectiveLevel()
+
+        assert logger.is_enabled_for(Logger.CRITICAL)
+        assert (logger.is_enabled_for(Logger.DEBUG) ==
+                (Logger.DEBUG >= effective_level))
+
+    def test_disabled_level_skips_stack_inspection(self):
+        logger = self.logger
+        adapter = logger.logger
+        original_level = adapter.logger.level
+        original_method = logger._method
+
+        calls = []
+        logger._method = lambda: calls.append(True) or original_method()
+        adapter.logger.setLevel(Logger.ERROR)
+        try:
+            logger.debug("This message should not be logged.")
+            assert calls == []
+
+            logger.error("This message should be logged.")
+            assert len(calls) == 1
+        finally:
+            adapter.logger.setLevel(original_level)
+            del logger._method
+
     def test_determine_project(self):
         filename = inspect.stack()[-1].filename
         expected_file_path = os.path.sep.join(filename.split(os.path.sep)[:-1])
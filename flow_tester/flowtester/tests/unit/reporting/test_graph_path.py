@@ -1,4 +1,4 @@
-from typing import List, NoReturn
+from typing import NoReturn, Sequence
 
 from flowtester.logging.logger import Logger
 from flowtester.reporting.graph_path import GraphPath
@@ -18,8 +18,8 @@ class TestGraphPath:
     NUM_ITEMS_PER_LINE = 3
     LINES_PER_ROW = 4
 
-    PATH = [f'ITEM_{x}' for x in range(NUM_STEPS)]
-    TRIGGERS = [f'TGR_{x}' for x in range(NUM_STEPS)]
+    PATH = tuple(f'ITEM_{x}' for x in range(NUM_STEPS))
+    TRIGGERS = tuple(f'TGR_{x}' for x in range(NUM_STEPS))
 
     def test_default_functionality(self):
         self._test_functionality(items=self.PATH)
@@ -48,13 +48,13 @@ class TestGraphPath:
             items=self.PATH, items_per_line=5)
 
     def test_long_element_name(self):
-        path = self.PATH[:]
+        path = list(self.PATH)
         path[-1] = "This is a really long name"
         self._test_functionality(items=path)
 
     def _test_functionality(
-            self, items: List[str],
-            triggers: List[str] = None,
+            self, items: Sequence[str],
+            triggers: Sequence[str] = None,
             items_per_line: int = NUM_ITEMS_PER_LINE,
             add_index: bool = False) -> NoReturn:
         """
@@ -62,8 +62,8 @@ class TestGraphPath:
         string.
 
         Args:
-            items List[str]: List of elements to put into graph
-            triggers List[str]: List of triggers to list above each item
+            items Sequence[str]: Sequence of elements to put into graph
+            triggers Sequence[str]: Sequence of triggers to list above each item
             items_per_line (int): Number of elements per line in graph
             add_index (bool): Add incrementing index to each element
 
@@ -1,12 +1,13 @@
 import os
+import pickle
+import tempfile
 from typing import NoReturn
 
+from flowtester.state_machine.config import yaml_cfg
 from flowtester.state_machine.config.yaml_cfg import YamlInputFile
 from flowtester.logging.logger import Logger
 from flowtester.tests.unit.utils import get_data_dir
 
-from nose.tools import assert_equals, assert_not_equals, assert_greater_equal
-
 logging = Logger()
 
 
@@ -19,6 +20,9 @@ class TestYamlFile:
     NON_EXISTING_YAML_FILE = 'this_does_not_exist.yaml'
     MALFORMED_YAML_FILE = 'general_malformed.yaml'
 
+    DATA_PATH = get_data_dir(
+        test_dir_name=TESTS_SUBDIR, data_dir_name=DATA_SUBDIR)
+
     def test_input_file_does_not_exist(self) -> NoReturn:
         # """
         # A non-existent YAML file returns '{}'
@@ -28,15 +32,12 @@ class TestYamlFile:
         # """
 
         # Build file path
-        data_path = get_data_dir(
-            test_dir_name=self.TESTS_SUBDIR, data_dir_name=self.DATA_SUBDIR)
-        data_file = os.path.sep.join(
-            [data_path, self.NON_EXISTING_YAML_FILE])
+        data_file = os.path.join(self.DATA_PATH, self.NON_EXISTING_YAML_FILE)
 
         # Read in data file
         test_file_obj = YamlInputFile(input_file=data_file)
 
-        assert_equals(test_file_obj.data, {})
+        assert test_file_obj.data == {}
 
     def test_input_file_exists(self) -> NoReturn:
         # """
@@ -47,16 +48,24 @@ class TestYamlFile:
         #
         # """
         # Build file path
-        data_path = get_data_dir(
-            test_dir_name=self.TESTS_SUBDIR, data_dir_name=self.DATA_SUBDIR)
-        data_file = os.path.sep.join(
-            [data_path, self.EXISTING_YAML_FILE])
+        data_file = os.path.join(self.DATA_PATH, self.EXISTING_YAML_FILE)
 
         # Read in data file
         test_file_obj = YamlInputFile(input_file=data_file)
 
-        assert_not_equals(test_file_obj.data, {})
-        assert_greater_equal(len(list(test_file_obj.data.keys())), 1)
+        assert test_file_obj.data != {}
+        assert len(test_file_obj.data) >= 1
+
+    def test_input_file_is_a_directory(self) -> NoReturn:
+        # """
+        # A directory (instead of a YAML file) returns '{}'
+        #
+        # Returns:
+        #     None
+        # """
+        test_file_obj = YamlInputFile(input_file=self.DATA_PATH)
+
+        assert test_file_obj.data == {}
 
     def test_malformed_yaml_file(self) -> NoReturn:
         # """
@@ -67,12 +76,136 @@ class TestYamlFile:
         #
         # """
         # Build file path
-        data_path = get_data_dir(
-            test_dir_name=self.TESTS_SUBDIR, data_dir_name=self.DATA_SUBDIR)
-        data_file = os.path.sep.join(
-            [data_path, self.MALFORMED_YAML_FILE])
+        data_file = os.path.join(self.DATA_PATH, self.MALFORMED_YAML_FILE)
 
         # Read in data file
         test_file_obj = YamlInputFile(input_file=data_file)
 
-        assert_equals(test_file_obj.data, {})
+        assert test_file_obj.data == {}
+
+    def test_empty_yaml_file(self) -> NoReturn:
+        # """
+        # An empty YAML file returns '{}'
+        #
+        # Returns:
+        #     None
+        #
+        # """
+        with tempfile.NamedTemporaryFile(suffix='.yaml') as empty_file:
+            test_file_obj = YamlInputFile(input_file=empty_file.name)
+
+        assert test_file_obj.data == {}
+
+    def test_unscannable_yaml_file(self) -> NoReturn:
+        # """
+        # A YAML file that fails in the scanner (rather than the parser) is
+        # also malformed and returns '{}'
+        #
+        # Returns:
+        #     None
+        #
+        # """
+        with tempfile.NamedTemporaryFile(
+                mode='w', suffix='.yaml') as yaml_file:
+            yaml_file.write('key: "unterminated\n')
+            yaml_file.flush()
+            test_file_obj = YamlInputFile(input_file=yaml_file.name)
+
+        assert test_file_obj.data == {}
+
+    def test_reread_yaml_file_returns_copy(self) -> NoReturn:
+        # """
+        # A re-read YAML file returns a fresh copy of the (cached) data, and
+        # is re-parsed if the file has been changed.
+        #
+        # Returns:
+        #     None
+        #
+        # """
+        with tempfile.NamedTemporaryFile(
+                mode='w', suffix='.yaml') as yaml_file:
+            yaml_file.write('key: [1, 2]\n')
+            yaml_file.flush()
+
+            # Modifying the data should not change the data of later reads
+            first_obj = YamlInputFile(input_file=yaml_file.name)
+            first_obj.data['key'].append(3)
+            second_obj = YamlInputFile(input_file=yaml_file.name)
+            assert second_obj.data == {'key': [1, 2]}
+
+            # Changing the file should be reflected by later reads
+            yaml_file.seek(0)
+            yaml_file.write('key: [1, 2, 3, 4]\n')
+            yaml_file.flush()
+            third_obj = YamlInputFile(input_file=yaml_file.name)
+
+        assert third_obj.data == {'key': [1, 2, 3, 4]}
+
+    def test_yaml_cache_file(self) -> NoReturn:
+        # """
+        # With cache_file enabled, the parsed data is written to a cache file,
+        # which is used instead of parsing the YAML until the YAML changes.
+        #
+        # Returns:
+        #     None
+        #
+        # """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = os.path.join(temp_dir, self.EXISTING_YAML_FILE)
+            with open(data_file, 'w') as yaml_file:
+                yaml_file.write('key: value\n')
+
+            # Parse the file and build the cache file
+            test_file_obj = YamlInputFile(
+                input_file=data_file, cache_file=True)
+            assert os.path.exists(test_file_obj.cache_file)
+
+            # Replace the cached data, so its use can be detected
+            with open(test_file_obj.cache_file, 'rb') as cache_file:
+                file_version, data = pickle.load(cache_file)
+            with open(test_file_obj.cache_file, 'wb') as cache_file:
+                pickle.dump((file_version, {'key': 'cached'}), cache_file)
+
+            # Not in memory, so the data is read from the cache file
+            yaml_cfg.clear_cache()
+            cached_obj = YamlInputFile(input_file=data_file, cache_file=True)
+            assert cached_obj.data == {'key': 'cached'}
+
+            # The YAML has changed, so the cache file is ignored and rebuilt
+            with open(data_file, 'w') as yaml_file:
+                yaml_file.write('key: new value\n')
+            updated_obj = YamlInputFile(input_file=data_file, cache_file=True)
+            assert updated_obj.data == {'key': 'new value'}
+
+    def test_corrupt_yaml_cache_file(self) -> NoReturn:
+        # """
+        # A cache file that cannot be unpickled is ignored, and the data is
+        # parsed from the YAML file.
+        #
+        # Returns:
+        #     None
+        #
+        # """
+        # Pickles referencing an unknown attribute or module, truncated and
+        # not in the expected format
+        corrupt_pickles = (
+            b'cbuiltins\nno_such_attribute\n.',
+            b'cno_such_module\nno_such_class\n.',
+            pickle.dumps(('version', 'data'))[:-3],
+            pickle.dumps(['not', 'a', 'version', 'and', 'data']),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = os.path.join(temp_dir, self.EXISTING_YAML_FILE)
+            with open(data_file, 'w') as yaml_file:
+                yaml_file.write('key: value\n')
+
+            for corrupt_pickle in corrupt_pickles:
+                with open(f"{data_file}{YamlInputFile.CACHE_FILE_SUFFIX}",
+                          'wb') as cache_file:
+                    cache_file.write(corrupt_pickle)
+
+                yaml_cfg.clear_cache()
+                test_file_obj = YamlInputFile(
+                    input_file=data_file, cache_file=True)
+                assert test_file_obj.data == {'key': 'value'}
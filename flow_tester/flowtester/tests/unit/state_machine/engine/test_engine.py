@@ -1,7 +1,10 @@
+import copy
 import os
 import tempfile
 from typing import Tuple
 
+from mock import patch
+
 from flowtester.logging.logger import Logger
 from flowtester.reporting.graph_path import GraphPath
 from flowtester.state_machine.config.constants \
@@ -9,15 +12,11 @@ from flowtester.state_machine.config.constants \
 from flowtester.state_machine.engine.input import PathStep
 from flowtester.state_machine.engine.engine import StateMachine
 from flowtester.tests.unit.utils import (
-    get_model_name_from_raw_file,
-    setup_state_machine_definitions)
+    get_data_file,
+    get_model_def,
+    get_model_name_from_raw_file)
 from flowtester.tests.data.basic_state_machine_obj_model import ImportCheck
 
-from nose.tools import (assert_equals, assert_greater_equal,
-                        assert_true, assert_false,
-                        assert_in, assert_not_in,
-                        raises)
-
 
 logging = Logger()
 
@@ -26,33 +25,56 @@ class TestStateMachine:
     MACHINE_DEFINITION_FILE = 'general_sample.yaml'
     SIMPLE_MACHINE_DEF_FILE = 'basic_state_machine.yaml'
 
+    @classmethod
+    def setup_class(cls):
+        # The state machine only reads the model definitions, so each
+        # definition file is loaded once and shared by all of the tests.
+        cls.model_defs = {
+            def_file: get_model_def(def_file)
+            for def_file in (cls.MACHINE_DEFINITION_FILE,
+                             cls.SIMPLE_MACHINE_DEF_FILE)}
+
+        # Object model shared by the tests that never call into it (tests
+        # that execute callbacks need their own, since the calls update it)
+        cls.obj_model = ImportCheck()
+
+        # Configured state machines: shared by the tests that only read them,
+        # and copied by the tests that change them (see _copy_state_machine)
+        cls.state_machines = {}
+        for def_file, model_def in cls.model_defs.items():
+            sm = StateMachine(data_model=model_def, object_model=cls.obj_model)
+            sm.configure_state_machine()
+            cls.state_machines[def_file] = sm
+
+        # Step id used for the trigger from each model's initial state
+        cls.initial_trigger_ids = {
+            def_file: f'from_{sm.machine.initial}'
+            for def_file, sm in cls.state_machines.items()}
+
     def test_model(self):
         # This tests a large percentage of the configure_state_machine.
         # Testing all paths is dependent on the model definition, and
         # general_sample.yaml contains the necessary conditions/definitions
         # to traverse all logic conditions.
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        model_def = self.model_defs[self.MACHINE_DEFINITION_FILE]
 
         sm = StateMachine(data_model=model_def, object_model=None)
         sm.configure_state_machine()
-        assert_true(isinstance(sm, StateMachine))
+        assert isinstance(sm, StateMachine)
 
     def test_get_model_name(self):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        def_file = get_data_file(self.MACHINE_DEFINITION_FILE)
 
-        sm = StateMachine(data_model=model_def, object_model=None)
+        sm = self.state_machines[self.MACHINE_DEFINITION_FILE]
         expected_model_name = get_model_name_from_raw_file(def_file)
 
         logging.info(f"Expected Model Name: {expected_model_name}")
         logging.info(f"Actual Model Name: {sm.name}")
 
-        assert_equals(sm.name, expected_model_name)
+        assert sm.name == expected_model_name
 
     def test__get_callback__exists(self):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.SIMPLE_MACHINE_DEF_FILE)
+        model_def = self.model_defs[self.SIMPLE_MACHINE_DEF_FILE]
 
         obj_model = ImportCheck()
 
@@ -60,49 +82,42 @@ class TestStateMachine:
         api = sm._get_callback('object_model.test_routine')
 
         # Verify the routine returned a Callable reference.
-        assert_true(callable(api))
+        assert callable(api)
 
         # Execute the API. It should return the default value, which is False
-        assert_equals(api(), ImportCheck.DEFAULT_RESPONSE)
+        assert api() == ImportCheck.DEFAULT_RESPONSE
 
-    @raises(AttributeError)
     def test__get_callback__does_not_exist(self):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
-
-        obj_model = ImportCheck()
+        model_def = self.model_defs[self.MACHINE_DEFINITION_FILE]
 
-        sm = StateMachine(data_model=model_def, object_model=obj_model)
+        sm = StateMachine(data_model=model_def, object_model=self.obj_model)
 
         # Should raise AttributeError since the method does not exist.
-        sm._get_callback('object_model.undefined_test_routine')
+        try:
+            sm._get_callback('object_model.undefined_test_routine')
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("AttributeError was not raised.")
 
     def test__set_execution_description_no_args(self):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        def_file = get_data_file(self.MACHINE_DEFINITION_FILE)
 
         expected_model_name = get_model_name_from_raw_file(def_file)
 
-        obj_model = ImportCheck()
-
-        sm = StateMachine(data_model=model_def, object_model=obj_model)
-        sm.configure_state_machine()
+        sm = self._copy_state_machine(self.MACHINE_DEFINITION_FILE)
         sm._set_execution_description()
-        assert_equals(sm.description, expected_model_name)
+        assert sm.description == expected_model_name
 
     def test__set_execution_description_with_text(self):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        def_file = get_data_file(self.MACHINE_DEFINITION_FILE)
 
         expected_model_name = get_model_name_from_raw_file(def_file)
         descr = "test_str"
 
-        obj_model = ImportCheck()
-
-        sm = StateMachine(data_model=model_def, object_model=obj_model)
-        sm.configure_state_machine()
+        sm = self._copy_state_machine(self.MACHINE_DEFINITION_FILE)
         sm._set_execution_description(descr)
-        assert_equals(sm.description, f"{expected_model_name} {descr}")
+        assert sm.description == f"{expected_model_name} {descr}"
 
     def test_execute_transition_callback_no_data(self):
         model_file = self.SIMPLE_MACHINE_DEF_FILE
@@ -125,17 +140,31 @@ class TestStateMachine:
         # Object model will update data based on specific routine called.
         # Check obj model to verify trigger routine matches the last call
         # recorded to the object_model.
-        assert_equals(trigger_callback.split('.')[-1],
-                      sm.object_model.last_call)
-        assert_equals(sm.object_model.data, data)
-
-    @staticmethod
-    def _setup_state_machine_for_execution(filename):
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            filename)
-        obj_model = ImportCheck()
-        sm = StateMachine(data_model=model_def, object_model=obj_model)
-        sm.configure_state_machine()
+        assert trigger_callback.rpartition('.')[2] == sm.object_model.last_call
+        assert sm.object_model.data == data
+
+    @classmethod
+    def _copy_state_machine(cls, filename: str) -> StateMachine:
+        """
+        Copy the shared, configured state machine (much cheaper than
+        configuring a new one), for tests that change the state machine.
+        The copy has its own machine, object model and reporter, but shares
+        the read-only model definition.
+
+        Args:
+            filename (str): Name of the model definition file
+
+        Returns:
+            Configured StateMachine
+        """
+        model_def = cls.model_defs[filename]
+        return copy.deepcopy(cls.state_machines[filename],
+                             memo={id(model_def): model_def})
+
+    @classmethod
+    def _setup_state_machine_for_execution(cls, filename):
+        model_def = cls.model_defs[filename]
+        sm = cls._copy_state_machine(filename)
 
         # Get data about transition configuration
         trans_data = model_def.get_transitions(sm.machine.initial)[0]
@@ -145,7 +174,7 @@ class TestStateMachine:
         trigger_name = trans_data[SMConsts.TRIGGER_NAME]
         sm.current_step = PathStep(
             trigger=trigger_name,
-            trigger_id=f'from_{sm.machine.initial}')
+            trigger_id=cls.initial_trigger_ids[filename])
         return sm, trigger_name, callback_routine
 
     def test_validate_current_state_without_expectations(self):
@@ -155,7 +184,7 @@ class TestStateMachine:
             self._setup_state_machine_for_execution(filename=model_file)
         getattr(sm, trigger_name)()
         result = sm.validate_current_state()
-        assert_equals(result, True)
+        assert result is True
 
     def test_validate_current_state_with_expectations(self):
         model_file = self.SIMPLE_MACHINE_DEF_FILE
@@ -165,7 +194,7 @@ class TestStateMachine:
             self._setup_state_machine_for_execution(filename=model_file)
         getattr(sm, trigger_name)()
         result = sm.validate_current_state(result=exp_result)
-        assert_equals(result, exp_result)
+        assert result == exp_result
 
     def test_validate_state_without_validations(self):
         model_file = self.SIMPLE_MACHINE_DEF_FILE
@@ -174,58 +203,58 @@ class TestStateMachine:
         sm, trigger_name, callback_routine = \
             self._setup_state_machine_for_execution(filename=model_file)
         result = sm.validate_current_state()
-        assert_equals(result, exp_result)
+        assert result == exp_result
 
     def test_generate_image_without_filename(self):
-        self._test_image_generation()
+        # Without a filename, the image is written to <model_name>.png in the
+        # current directory. Capture the file the graph would be drawn to
+        # (rather than writing into the current directory).
+        model_file = self.SIMPLE_MACHINE_DEF_FILE
+        expected_model_name = get_model_name_from_raw_file(
+            get_data_file(model_file))
+        expected_filename = os.path.abspath(f"{expected_model_name}.png")
+
+        sm = self._copy_state_machine(model_file)
+        with patch.object(sm.machine, 'get_graph') as mocked_graph:
+            image_name = sm.generate_image()
+
+        assert image_name == expected_filename
+        mocked_graph.return_value.draw.assert_called_once_with(
+            expected_filename, prog='dot')
 
     def test_generate_image_path_only(self):
         self._test_image_generation(path_only=True)
 
     def test_generate_image_wit_filename(self):
-        # Create a temporary image filename
-        filename = os.path.sep.join([
-            tempfile.gettempdir(),
-            f"{next(tempfile._get_candidate_names())}.png"])
-
-        logging.info(f"Temp file: {filename}")
-        self._test_image_generation(filename=filename)
+        self._test_image_generation()
 
-    def _test_image_generation(
-            self, filename: str = None, path_only: bool = False) -> None:
+    def _test_image_generation(self, path_only: bool = False) -> None:
         """
         Instantiate a state machine and generate an
-        image of the state machine.
+        image of the state machine (in a temporary directory, so tests
+        running in parallel, e.g. pytest -n auto, never share the file).
 
         Args:
-            filename (str): Filespec of file to store image
             path_only (str): Only generate the current image path
 
         Returns:
             None
         """
-        # Set up state machine configuration
+        # Get a (configured) state machine: drawing the graph updates it
         model_file = self.SIMPLE_MACHINE_DEF_FILE
-        def_file, model_cfg, model_def = setup_state_machine_definitions(
-            model_file)
-        expected_model_name = get_model_name_from_raw_file(def_file)
-
-        # Build state machine
-        obj_model = ImportCheck()
-        sm = StateMachine(data_model=model_def, object_model=obj_model)
-        sm.configure_state_machine()
+        sm = self._copy_state_machine(model_file)
 
-        # Generate image
-        image_name = sm.generate_image(filename=filename, path_only=path_only)
+        with tempfile.TemporaryDirectory() as work_dir:
+            filename = os.path.join(work_dir, "state_machine.png")
+            logging.info(f"Temp file: {filename}")
 
-        # Assure image filename is correct and file exists
-        filename = filename or os.path.abspath(f"{expected_model_name}.png")
-        assert_equals(filename, image_name)
-        assert_true(os.path.exists(image_name))
+            # Generate image
+            image_name = sm.generate_image(
+                filename=filename, path_only=path_only)
 
-        # Verify image is deleted
-        os.remove(image_name)
-        assert_false(os.path.exists(image_name))
+            # Assure image filename is correct and file exists
+            assert filename == image_name
+            assert os.path.exists(image_name)
 
     def test_state_machine_traversal_path(self):
         model_file = self.SIMPLE_MACHINE_DEF_FILE
@@ -235,7 +264,7 @@ class TestStateMachine:
 
         steps = [PathStep(
             trigger=trigger_name,
-            trigger_id=f'from_{sm.machine.initial}')]
+            trigger_id=self.initial_trigger_ids[model_file])]
 
         sm.execute_state_machine(input_data=steps)
 
@@ -244,8 +273,8 @@ class TestStateMachine:
         logging.info(f"EXPECTED PATH: {expected_path}")
         logging.info(f"ACTUAL PATH: {sm.path}")
 
-        assert_true(isinstance(sm.path, list))
-        assert_equals(expected_path, sm.path)
+        assert isinstance(sm.path, list)
+        assert expected_path == sm.path
 
     def test_state_machine_illegal_path(self):
         model_file = self.SIMPLE_MACHINE_DEF_FILE
@@ -257,7 +286,7 @@ class TestStateMachine:
         steps = [
             PathStep(
                 trigger=trigger_name,
-                trigger_id=f'from_{sm.machine.initial}'),
+                trigger_id=self.initial_trigger_ids[model_file]),
             PathStep(
                 trigger=illegal_trigger_name,
                 trigger_id="ILLEGAL STEP")
@@ -273,35 +302,35 @@ class TestStateMachine:
         logging.info(f"EXPECTED PATH: {expected_path}")
         logging.info(f"ACTUAL PATH: {sm.path}")
 
-        assert_true(isinstance(sm.path, list))
-        assert_equals(expected_path, sm.path)
+        assert isinstance(sm.path, list)
+        assert expected_path == sm.path
 
     def test_execution_summary(self):
 
         detailed = False
         trigger_name, trigger_id, report = self._execute_and_generate_summary(
             detailed=detailed)
-        assert_in(trigger_name, report)
-        assert_not_in(trigger_id, report)
-        assert_true(isinstance(report, str))
+        assert trigger_name in report
+        assert trigger_id not in report
+        assert isinstance(report, str)
 
     def test_execution_summary_detailed(self):
 
         detailed = True
         trigger_name, trigger_id, report = self._execute_and_generate_summary(
             detailed=detailed)
-        assert_in(trigger_name, report)
-        assert_in(trigger_id, report)
-        assert_true(isinstance(report, str))
+        assert trigger_name in report
+        assert trigger_id in report
+        assert isinstance(report, str)
 
     def test_traversal_path(self):
         sm, _, _ = self._setup_and_execute_state_machine()
         path = sm.traversal_path()
-        assert_true(isinstance(path, GraphPath))
+        assert isinstance(path, GraphPath)
 
         # Four line per GraphPath entry, so if there is only 1 state,
         # there should be at least 4 lines.
-        assert_greater_equal(len(str(path).split('\n')), 4)
+        assert str(path).count('\n') + 1 >= 4
 
     def _execute_and_generate_summary(self, detailed: bool = False) -> Tuple[str, str, str]:
         """
@@ -331,7 +360,7 @@ class TestStateMachine:
         sm, trigger_name, callback_routine = \
             self._setup_state_machine_for_execution(filename=model_file)
 
-        trigger_id = f'from_{sm.machine.initial}'
+        trigger_id = self.initial_trigger_ids[model_file]
         steps = [PathStep(
             trigger=trigger_name,
             trigger_id=trigger_id)]
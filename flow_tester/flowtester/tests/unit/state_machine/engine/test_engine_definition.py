@@ -1,5 +1,7 @@
+import json
 import pprint
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
 
 from mock import patch
 import prettytable
@@ -13,9 +15,6 @@ from flowtester.tests.unit.utils import (
     get_states_from_raw_file,
     setup_state_machine_definitions)
 
-from nose.tools import (assert_equals, assert_true, assert_false,
-                        assert_is_none, assert_in)
-
 logging = Logger()
 
 
@@ -31,52 +30,99 @@ class TestMachineDefinition:
     NUMBER_OF_TRANSITIONS = 6
 
     INVALID_TEST_STATE = 'DoesNOtexistz'
-    MULTI_TRIGGER_STATES = [f'STATE_{x}' for x in range(8)]
+    MULTI_TRIGGER_STATES = tuple(f'STATE_{x}' for x in range(8))
+
+    # Table columns used by the _add_trigger_to_table tests
+    TABLE_COL_DICT = {
+        MachineDefinition.STATE: 'Origin State',
+        MachineDefinition.TRIGGER: 'Trigger',
+        MachineDefinition.DESTINATION: 'Expected State',
+        MachineDefinition.TRIGGER_METHOD: 'Trigger Method',
+        MachineDefinition.VALIDATION_ID: 'Validation ID',
+        MachineDefinition.VALIDATION_ROUTINE: 'Validation Routine',
+        MachineDefinition.NOTES: 'Notes'
+    }
+    TABLE_FIELD_NAMES = list(TABLE_COL_DICT.values())
+
+    # Multi-source trigger definition added to the table (read-only)
+    WILDCARD = '*'
+    SOURCE_STATES_SAMPLE = ('STATE_1', 'STATE_2', 'STATE_3', 'STATE_40')
+    MULTI_TRIGGER_DEF_SOURCE_WC = MappingProxyType({
+        SMConsts.TRIGGER_NAME: 'test1',
+        SMConsts.DESCRIPTION: 'test1_description',
+        SMConsts.CHANGE_STATE_ROUTINE: "test1_callback",
+        SMConsts.DESTINATION_STATE: 'STATE_3',
+        SMConsts.SOURCE_STATES: WILDCARD
+    })
+
+    @classmethod
+    def setup_class(cls):
+        # Read and parse the definition file once, and keep a JSON snapshot
+        # of the data. Tests that alter the data get their own copy (see
+        # _fresh()); loading the snapshot is several times faster than
+        # deep-copying the parsed data.
+        cls.cfg_file, model_cfg, _ = setup_state_machine_definitions(
+            cls.MACHINE_DEFINITION_FILE)
+        cls.cfg_snapshot = json.dumps(model_cfg.data)
+
+        # Shared by the tests that only read the definition (tests that alter
+        # the data or the lists returned by the definition use _fresh()).
+        cls.shared_definition = cls._fresh()
+
+        # Empty machine definition used to build the table output
+        cls.empty_model_def = MachineDefinition(data={})
+
+    @classmethod
+    def _fresh(cls) -> Tuple[str, dict, MachineDefinition]:
+        """
+        Build an independent copy of the parsed definition file.
+
+        Returns:
+            Tuple of model_definition_file (str), the parsed file data (dict),
+            and a MachineDefinition obj built from a separate copy of the data.
+
+        """
+        return (cls.cfg_file, json.loads(cls.cfg_snapshot),
+                MachineDefinition(data=json.loads(cls.cfg_snapshot)))
 
     def test_get_model_name(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
 
         model_name = model_def.get_model_name()
-        assert_equals(model_name, model_cfg.data[SMConsts.MODEL_NAME])
+        assert model_name == cfg_data[SMConsts.MODEL_NAME]
 
     def test_get_initial_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         init_state = model_def.get_initial_state()
-        assert_equals(init_state, model_cfg.data[SMConsts.INITIAL_STATE])
+        assert init_state == cfg_data[SMConsts.INITIAL_STATE]
 
     def test_get_initial_state_is_none(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self._fresh()
         model_def.data[SMConsts.INITIAL_STATE] = None
 
         init_state = model_def.get_initial_state()
-        assert_is_none(init_state)
+        assert init_state is None
 
     def test_get_state_definitions(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         defs = model_def.get_state_definitions()
 
         # Get all of the states (but remove the entries prefixed with
         # the StateMachineConstants.NON_STATE_PREFIX)
-        test_model = model_cfg.data[SMConsts.DEFINITION]
-        test_model = [x for x in test_model if
-                      not list(x.keys())[0].startswith(
-                          SMConsts.NON_STATE_PREFIX)]
+        prefix = SMConsts.NON_STATE_PREFIX
+        test_model = [x for x in cfg_data[SMConsts.DEFINITION]
+                      if not next(iter(x)).startswith(prefix)]
 
         num_states = len(test_model)
         logging.debug(f"\nExpected Number of States: {num_states}:\n"
                       f"{test_model}")
         logging.debug(f"Received: {len(defs)}:\n{defs}")
 
-        assert_true(defs, isinstance(defs, list))
-        assert_equals(len(defs), num_states)
+        assert defs and isinstance(defs, list)
+        assert len(defs) == num_states
 
     def test_get_state_definition_with_existing_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         state_def = model_def.get_state_definition(state=self.VALID_TEST_STATE)
 
         logging.info(f"STATE NAME: {self.VALID_TEST_STATE}")
@@ -84,22 +130,20 @@ class TestMachineDefinition:
                      f"{self.VALID_TEST_STATE_DESCRIPTION}")
         logging.info(state_def)
 
-        assert_true(isinstance(state_def, dict))
-        assert_equals(state_def[SMConsts.DESCRIPTION],
-                      self.VALID_TEST_STATE_DESCRIPTION)
+        assert isinstance(state_def, dict)
+        assert (state_def[SMConsts.DESCRIPTION] ==
+                self.VALID_TEST_STATE_DESCRIPTION)
 
     def test_get_state_definition_with_non_existing_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         state_def = model_def.get_state_definition(
             state=self.INVALID_TEST_STATE)
 
-        assert_true(isinstance(state_def, dict))
-        assert_equals(state_def, {})
+        assert isinstance(state_def, dict)
+        assert state_def == {}
 
     def test_get_list_of_states(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
 
         expected_states = get_states_from_raw_file(yaml_file=cfg_file)
         returned_states = model_def.get_list_of_states()
@@ -107,77 +151,66 @@ class TestMachineDefinition:
         logging.info(f"Expected States: {expected_states}")
         logging.info(f"Returned States: {returned_states}")
 
-        assert_equals(set(expected_states) ^ set(returned_states), set())
+        assert sorted(expected_states) == sorted(returned_states)
 
     def test__is_state_valid_with_valid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
-        assert_true(model_def._is_state_valid(self.VALID_TEST_STATE))
+        _, cfg_data, model_def = self.shared_definition
+        assert model_def._is_state_valid(self.VALID_TEST_STATE)
 
     def test__is_state_valid_with_invalid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
-        assert_false(model_def._is_state_valid(self.INVALID_TEST_STATE))
+        _, cfg_data, model_def = self.shared_definition
+        assert not model_def._is_state_valid(self.INVALID_TEST_STATE)
 
     def test_get_state_validation_methods_valid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         validations = model_def.get_state_validation_methods(
             self.VALID_TEST_STATE)
 
-        assert_true(isinstance(validations, list))
-        assert_equals(len(validations), 2)
-        assert_true(isinstance(validations[0], dict))
-        assert_equals(validations[0][SMConsts.NAME],
-                      self.VALID_TEST_STATE.lower())
+        assert isinstance(validations, list)
+        assert len(validations) == 2
+        assert isinstance(validations[0], dict)
+        assert validations[0][SMConsts.NAME] == self.VALID_TEST_STATE.lower()
 
     def test_get_state_validation_methods_invalid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         validations = model_def.get_state_validation_methods(
             self.INVALID_TEST_STATE)
-        assert_equals(validations, [])
+        assert validations == []
 
     def test_get_transitions_for_invalid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         transitions = model_def.get_transitions(self.INVALID_TEST_STATE)
-        assert_equals(transitions, [])
+        assert transitions == []
 
     def test_get_transitions_for_valid_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         transitions = model_def.get_transitions(self.VALID_TEST_STATE)
-        assert_equals(len(transitions), self.NUMBER_OF_TRANSITIONS)
-        assert_true(isinstance(transitions[0], dict))
-        assert_in(self.VALID_TRANSITION_NAME,
-                  [x[SMConsts.TRIGGER_NAME] for x in transitions])
+        assert len(transitions) == self.NUMBER_OF_TRANSITIONS
+        assert isinstance(transitions[0], dict)
+        assert self.VALID_TRANSITION_NAME in (
+            x[SMConsts.TRIGGER_NAME] for x in transitions)
 
     def test_get_transitions_for_none_state(self):
-        _, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        _, cfg_data, model_def = self.shared_definition
         transitions = model_def.get_transitions(None)
-        assert_equals(transitions, [])
+        assert transitions == []
 
     def test_get_all_triggers(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         expected_triggers = get_triggers_from_raw_file(cfg_file)
         reported_triggers = model_def.get_all_triggers()
 
         logging.info(f"EXPECTED TRIGGERS: {expected_triggers}")
         logging.info(f"REPORTED TRIGGERS: {reported_triggers}")
 
-        assert_equals(set(expected_triggers) ^ set(reported_triggers), set())
+        assert sorted(expected_triggers) == sorted(reported_triggers)
 
     def test_describe_model_does_not_crash(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
-        assert_true(isinstance(model_def.describe_model(), str))
+        cfg_file, cfg_data, model_def = self.shared_definition
+        assert isinstance(model_def.describe_model(), str)
 
     def test_get_transition_info_for_valid_state(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         transitions = model_def.get_transitions(self.VALID_TEST_STATE)
         trans_tuple = (t_name, t_dest, t_method) = \
             model_def.get_transition_info(transitions[0])
@@ -185,21 +218,19 @@ class TestMachineDefinition:
                      f"{set(list(transitions[0].values()))}")
         logging.info(f"Received transition Data tuple: {set(trans_tuple)}")
 
-        assert_equals(t_name, transitions[0][SMConsts.TRIGGER_NAME])
-        assert_equals(t_dest, transitions[0][SMConsts.DESTINATION_STATE])
-        assert_equals(t_method, transitions[0][SMConsts.CHANGE_STATE_ROUTINE])
+        assert t_name == transitions[0][SMConsts.TRIGGER_NAME]
+        assert t_dest == transitions[0][SMConsts.DESTINATION_STATE]
+        assert t_method == transitions[0][SMConsts.CHANGE_STATE_ROUTINE]
 
     def test_get_transition_info_for_invalid_state(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         transitions = model_def.get_transitions(self.INVALID_TEST_STATE)
-        assert_equals(transitions, [])
+        assert transitions == []
 
     def test_get_transition_info_for_undefined_transition(self):
         error_msg = 'Not Found'
 
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self._fresh()
         transitions = model_def.get_transitions(self.VALID_TEST_STATE)
         transitions[0] = {}
 
@@ -208,116 +239,96 @@ class TestMachineDefinition:
                      f"{[error_msg for _ in range(3)]}")
         logging.info(f"Received transition Data tuple: {set(trans_tuple)}")
 
-        for msg in trans_tuple:
-            assert_equals(msg, error_msg)
+        assert trans_tuple == (error_msg, error_msg, error_msg)
 
     def test_get_transition_info_by_name_valid_state_and_name(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
+        expected_info = model_def.get_transitions(
+            self.VALID_TEST_STATE)[self.VALID_TRANSITION_INDEX]
+
         trigger_info = model_def.get_transition_info_by_name(
             state_name=self.VALID_TEST_STATE,
             trigger_name=self.VALID_TRANSITION_NAME)
 
-        transitions = model_def.get_transitions(
-            self.VALID_TEST_STATE)[self.VALID_TRANSITION_INDEX]
-        for key, value in transitions.items():
-            assert_true(key in trigger_info)
-            assert_equals(value, trigger_info[key])
+        assert trigger_info == expected_info
 
     def test_get_transition_info_by_name_valid_state_and_invalid_name(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         trigger_info = model_def.get_transition_info_by_name(
             state_name=self.VALID_TEST_STATE,
             trigger_name=self.INVALID_TEST_STATE)
 
-        assert_equals(trigger_info, {})
+        assert trigger_info == {}
 
     def test_get_transition_info_by_name_invalid_state_and_name(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         trigger_info = model_def.get_transition_info_by_name(
             state_name=self.INVALID_TEST_STATE,
             trigger_name=self.INVALID_TEST_STATE)
 
-        assert_equals(trigger_info, {})
+        assert trigger_info == {}
 
     def test_validate_path_with_valid_path(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         path = get_triggers_from_raw_file(yaml_file=cfg_file)
-        assert_true(model_def.validate_path(path))
+        assert model_def.validate_path(path)
 
     def test_validate_path_with_invalid_path(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         path = get_states_from_raw_file(yaml_file=cfg_file)
-        assert_false(model_def.validate_path(path))
+        assert not model_def.validate_path(path)
 
     def test_validate_multi_triggers(self):
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         triggers = model_def.get_multi_triggers()
         validated_triggers = model_def.validate_multi_triggers(triggers)
 
-        assert_true(isinstance(validated_triggers, list))
-        assert_true(validated_triggers)
+        assert isinstance(validated_triggers, list)
+        assert validated_triggers
 
     def test_get_multi_triggers(self):
-        expected_trigger_names = [
+        expected_trigger_names = (
             'multi_trigger_test_from_all',
-            'multi_trigger_test_from_select_states']
+            'multi_trigger_test_from_select_states')
 
-        cfg_file, model_cfg, model_def = setup_state_machine_definitions(
-            self.MACHINE_DEFINITION_FILE)
+        cfg_file, cfg_data, model_def = self.shared_definition
         triggers = model_def.get_multi_triggers()
-        trigger_names = [x.get(SMConsts.TRIGGER_NAME) for x in triggers]
+        trigger_names = tuple(x.get(SMConsts.TRIGGER_NAME) for x in triggers)
 
-        assert_true(isinstance(triggers, list))
-        assert_true(triggers)
-        assert_equals(expected_trigger_names, trigger_names)
+        assert isinstance(triggers, list)
+        assert triggers
+        assert expected_trigger_names == trigger_names
 
     def test__add_trigger_to_table_valid_with_wc(self):
-        wildcard = '*'
-        multi_trigger_defs_source_wc = {
-            SMConsts.TRIGGER_NAME: 'test1',
-            SMConsts.DESCRIPTION: 'test1_description',
-            SMConsts.CHANGE_STATE_ROUTINE: "test1_callback",
-            SMConsts.DESTINATION_STATE: 'STATE_3',
-            SMConsts.SOURCE_STATES: wildcard
-        }
-
         table = self.__add_trigger_to_table_content(
-            trigger_def=multi_trigger_defs_source_wc)
-        assert_true(isinstance(table, prettytable.PrettyTable))
-        assert_in(wildcard, table.get_string())
+            trigger_def=self.MULTI_TRIGGER_DEF_SOURCE_WC)
+        assert isinstance(table, prettytable.PrettyTable)
+        assert self.WILDCARD in table.get_string()
 
     def test__add_trigger_to_table_valid_with_source_state_list(self):
-        source_states = ['STATE_1', 'STATE_2', 'STATE_3', 'STATE_40']
-        multi_trigger_defs_source_list = {
-            SMConsts.TRIGGER_NAME: 'test1',
-            SMConsts.DESCRIPTION: 'test1_description',
-            SMConsts.CHANGE_STATE_ROUTINE: "test1_callback",
-            SMConsts.DESTINATION_STATE: 'STATE_3',
-            SMConsts.SOURCE_STATES: source_states
+        # Source states are a list, as read from the YAML file (any other
+        # type is handled as a wildcard), so the definition is built here.
+        multi_trigger_def_source_list = {
+            **self.MULTI_TRIGGER_DEF_SOURCE_WC,
+            SMConsts.SOURCE_STATES: list(self.SOURCE_STATES_SAMPLE)
         }
 
         table = self.__add_trigger_to_table_content(
-            trigger_def=multi_trigger_defs_source_list)
-        assert_true(isinstance(table, prettytable.PrettyTable))
+            trigger_def=multi_trigger_def_source_list)
+        assert isinstance(table, prettytable.PrettyTable)
 
         # Verify each source state is diplayed in the table
         table_str = table.get_string()
-        for state in source_states:
-            assert_in(state, table_str)
+        for state in self.SOURCE_STATES_SAMPLE:
+            assert state in table_str
 
     def test__add_trigger_to_table_empty(self):
         table = self.__add_trigger_to_table_content(trigger_def=dict())
-        assert_true(isinstance(table, prettytable.PrettyTable))
+        assert isinstance(table, prettytable.PrettyTable)
 
     def test__add_trigger_to_table_is_none(self):
         table = self.__add_trigger_to_table_content(trigger_def=None)
-        assert_true(isinstance(table, prettytable.PrettyTable))
+        assert isinstance(table, prettytable.PrettyTable)
 
     @patch('flowtester.state_machine.engine.engine_definition.'
            'MachineDefinition.get_state_validation_methods',
@@ -342,26 +353,16 @@ class TestMachineDefinition:
         Returns:
             Populated table (prettytable.PrettyTable)
         """
-        col_dict = {
-            MachineDefinition.STATE: 'Origin State',
-            MachineDefinition.TRIGGER: 'Trigger',
-            MachineDefinition.DESTINATION: 'Expected State',
-            MachineDefinition.TRIGGER_METHOD: 'Trigger Method',
-            MachineDefinition.VALIDATION_ID: 'Validation ID',
-            MachineDefinition.VALIDATION_ROUTINE: 'Validation Routine',
-            MachineDefinition.NOTES: 'Notes'
-        }
-
         # Build table
         table = prettytable.PrettyTable()
-        table.field_names = list(col_dict.values())
+        table.field_names = self.TABLE_FIELD_NAMES
 
-        # Build machine definition for table output
-        model_def = MachineDefinition(data={})
-        updated_table = model_def._add_trigger_to_table(
-            table_obj=table, col_dict=col_dict,
+        # Add the trigger to the table (using the empty machine definition)
+        updated_table = self.empty_model_def._add_trigger_to_table(
+            table_obj=table, col_dict=self.TABLE_COL_DICT,
             trigger=trigger_def)
 
         # Display results (on failure or debugging)
-        logging.debug(pprint.pformat(updated_table.get_string()))
+        if logging.is_enabled_for(Logger.DEBUG):
+            logging.debug(pprint.pformat(updated_table.get_string()))
         return table
@@ -1,108 +1,108 @@
-from random import choice
-from typing import List, NoReturn
-from uuid import uuid4
+import itertools
+from typing import NoReturn, Sequence
 
 from flowtester.logging.logger import Logger
 from flowtester.state_machine.engine.input import PathStep
 
-from nose.tools import assert_equals, assert_true
-
 
 logging = Logger()
 
+# Source of distinct test strings (ids/data)
+_counter = itertools.count()
+
 
 class TestPathStep:
 
     TRIGGER_NAME = 'TEST'
 
+    # Validation ids and the corresponding expectations
+    SINGLE_VALIDATION_IDS = ('test',)
+    SINGLE_EXPECTATIONS = (False,)
+    MULTIPLE_VALIDATION_IDS = ('test_1', 'test_2', 'test_3')
+    MULTIPLE_EXPECTATIONS = (False, True, False)
+
+    def _new_step(self) -> PathStep:
+        return PathStep(trigger=self.TRIGGER_NAME)
+
     def test__str__does_not_crash(self):
-        test_id = str(uuid4())
-        validation_ids = ['test']
-        expectations = [False]
+        test_id = f"test-id-{next(_counter)}"
 
-        step = PathStep(trigger=self.TRIGGER_NAME)
+        step = self._new_step()
         step.add_id(step_id=test_id)
         self._add_and_validate_expectations(
-            validation_ids=validation_ids, expectations=expectations)
+            step=step, validation_ids=self.SINGLE_VALIDATION_IDS,
+            expectations=self.SINGLE_EXPECTATIONS)
 
-        assert_true(isinstance(str(step), str))
+        assert isinstance(str(step), str)
 
     def test_add_id(self):
 
         # Verify ID is added to PathStep correctly
 
-        test_id = str(uuid4())
-        step = PathStep(trigger=self.TRIGGER_NAME)
+        test_id = f"test-id-{next(_counter)}"
+        step = self._new_step()
         step.add_id(step_id=test_id)
 
-        assert_equals(step.id, test_id)
+        assert step.id == test_id
 
     def test_add_data(self):
 
         # Verify data is added to PathStep correctly
 
-        test_data = str(uuid4())
-        step = PathStep(trigger=self.TRIGGER_NAME)
+        test_data = f"test-data-{next(_counter)}"
+        step = self._new_step()
         step.add_data(data=test_data)
 
-        assert_equals(step.trigger_data, test_data)
+        assert step.trigger_data == test_data
 
     def test_add_single_expectation(self):
 
         # Verify expectation is added to PathStep correctly
 
-        validation_ids = ['test']
-        expectations = [False]
         self._add_and_validate_expectations(
-            validation_ids=validation_ids, expectations=expectations)
+            step=self._new_step(), validation_ids=self.SINGLE_VALIDATION_IDS,
+            expectations=self.SINGLE_EXPECTATIONS)
 
     def test_add_multiple_expectations(self):
 
         # Verify expectations (plural) are added to PathStep correctly
 
-        validation_ids = ['test_1', 'test_2', 'test_3']
-        expectations = [False, True, False]
         self._add_and_validate_expectations(
-            validation_ids=validation_ids, expectations=expectations)
+            step=self._new_step(),
+            validation_ids=self.MULTIPLE_VALIDATION_IDS,
+            expectations=self.MULTIPLE_EXPECTATIONS)
 
+    @staticmethod
     def _add_and_validate_expectations(
-            self, validation_ids: List[str],
-            expectations: List[bool]) -> NoReturn:
+            step: PathStep, validation_ids: Sequence[str],
+            expectations: Sequence[bool]) -> NoReturn:
 
         # Add requested expectations
-        step = PathStep(trigger=self.TRIGGER_NAME)
         for id_, expect in zip(validation_ids, expectations):
             step.add_expectation(
                 validation_id=id_, expectation=expect)
 
         # Verify the expectations were added correctly (format and value)
-        assert_equals(len(step.expectations), len(validation_ids))
-        for index in range(len(validation_ids)):
-            assert_equals(
-                step.expectations[index][PathStep.ID],
-                validation_ids[index])
-            assert_equals(
-                step.expectations[index][PathStep.EXPECTATION],
-                expectations[index])
+        assert len(step.expectations) == len(validation_ids)
+        id_key, expectation_key = PathStep.ID, PathStep.EXPECTATION
+        for exp_dict, id_, expect in zip(
+                step.expectations, validation_ids, expectations):
+            assert exp_dict[id_key] == id_
+            assert exp_dict[expectation_key] == expect
 
     def test_get_expectations(self):
 
         # Verify requested expectation value is returned
 
-        validation_ids = ['test_1', 'test_2']
-        expectations = [False, True]
-        target_index = choice(range(len(expectations)))
-
-        logging.info(f"Selecting expectation element: {target_index}")
+        validation_ids = ('test_1', 'test_2')
+        expectations = (False, True)
 
         # Add expectations
-        step = PathStep(trigger=self.TRIGGER_NAME)
+        step = self._new_step()
         for id_, expect in zip(validation_ids, expectations):
             step.add_expectation(
                 validation_id=id_, expectation=expect)
 
-        # Get randomly selected expectation (selected from expectations added)
-        expectation = step.get_expectation(validation_ids[target_index])
-
-        # Verify return value matches the expectation
-        assert_equals(expectation, expectations[target_index])
+        # Verify each returned value matches the corresponding expectation
+        for id_, expect in zip(validation_ids, expectations):
+            assert step.get_expectation(id_) == expect
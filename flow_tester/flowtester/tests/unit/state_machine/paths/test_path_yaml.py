@@ -1,10 +1,13 @@
-from random import choice
-from typing import NoReturn
+import copy
+import os
+import shutil
+import tempfile
+from typing import List, NoReturn
 
 from mock import patch
-from nose.tools import assert_equals, assert_not_equals, assert_in, assert_true
 
 from flowtester.logging.logger import Logger
+from flowtester.state_machine.config import yaml_cfg
 from flowtester.state_machine.paths.path_yaml import StatePathsYaml
 from flowtester.tests.unit.utils import get_data_file
 
@@ -16,6 +19,41 @@ class TestStatePathsYaml:
     TEST_DIR_NAME = 'tests'
     SAMPLE_PATH = 'sample_path.yaml'
 
+    # Expected contents of the sample path file (names are frozensets since
+    # the tests mostly check membership)
+    NUM_TEST_SUITES = 2
+    TEST_SUITE_NAMES = frozenset(
+        f"EXAMPLE_{x + 1}" for x in range(NUM_TEST_SUITES))
+    NUM_TEST_CASES = 2
+    TEST_CASE_NAMES = frozenset(
+        f'test_{x + 1}' for x in range(NUM_TEST_CASES))
+    NUM_STEPS_IN_TEST_CASE = 4
+    STEP_NAMES = frozenset(
+        f"STEP_{x + 1}" for x in range(NUM_STEPS_IN_TEST_CASE))
+    NUM_EXPECTATIONS = 2
+    EXPECTATION_IDS = tuple(
+        f"expectation_{x + 1}" for x in range(NUM_EXPECTATIONS))
+    EXPECTATIONS_TEST_SUITE = 'EXAMPLE_1'
+    EXPECTATIONS_TEST_CASE = 'test_1'
+
+    @classmethod
+    def setup_class(cls):
+        cls.data_file = get_data_file(
+            filename=cls.SAMPLE_PATH,
+            test_dir_name=cls.TEST_DIR_NAME,
+            data_dir_name=cls.DATA_DIR_NAME)
+
+        # Shared by the tests that do not build a test case: the object keeps
+        # the last test case built and get_traversal_path() falls back to it,
+        # so those tests build their own object.
+        cls.state_path_obj = StatePathsYaml(cls.data_file)
+
+        # Test case definition (built by a separate object, see above) for the
+        # tests that only pass a definition to the routine under test.
+        cls.test_case_def = StatePathsYaml(cls.data_file).build_test_case(
+            test_suite=cls.EXPECTATIONS_TEST_SUITE,
+            test_name=cls.EXPECTATIONS_TEST_CASE)
+
     def test_get_test_suites(self) -> NoReturn:
         # """
         #
@@ -26,27 +64,62 @@ class TestStatePathsYaml:
         # """
 
         # Determine expected data
-        num_test_suites = 2
-        expected_test_suite_names = [
-            f"EXAMPLE_{x + 1}" for x in range(num_test_suites)]
-
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+        num_test_suites = self.NUM_TEST_SUITES
+        expected_test_suite_names = self.TEST_SUITE_NAMES
 
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         test_suites = state_path_obj.get_test_suites()
 
         logging.info(f"EXPECTED TEST SUITES: {expected_test_suite_names}")
         logging.info(f"RETURNED TEST SUITES: {test_suites}")
 
         # Verify right number and names are returned.
-        assert_equals(len(test_suites), num_test_suites)
+        assert len(test_suites) == num_test_suites
         for name in test_suites:
-            assert_in(name, expected_test_suite_names)
+            assert name in expected_test_suite_names
+
+    def test_read_with_cache_file(self):
+        # Parsed data is kept in a cache file next to the YAML file, and the
+        # data read back is the same as the parsed data.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = os.path.join(temp_dir, self.SAMPLE_PATH)
+            shutil.copyfile(self.data_file, data_file)
+
+            state_path_obj = StatePathsYaml(data_file, cache_file=True)
+            assert os.path.exists(state_path_obj.cache_file)
+
+            # Not in memory, so the data is read from the cache file
+            yaml_cfg.clear_cache()
+            cached_obj = StatePathsYaml(data_file, cache_file=True)
+            assert cached_obj.data == self.state_path_obj.data
+
+    def test_data_is_list_of_test_suites(self):
+        # The data keeps the file's structure: a list of single-key
+        # dictionaries, one per test suite
+        data = self.state_path_obj.data
+        assert isinstance(data, list)
+        assert [len(ts) for ts in data] == [1] * self.NUM_TEST_SUITES
+
+    def test_duplicate_test_suite_uses_first_definition(self):
+        with tempfile.NamedTemporaryFile(
+                mode='w', suffix='.yaml') as yaml_file:
+            yaml_file.write('- SUITE:\n'
+                            '    first_test: {}\n'
+                            '- SUITE:\n'
+                            '    second_test: {}\n')
+            yaml_file.flush()
+            state_path_obj = StatePathsYaml(yaml_file.name)
+
+        assert state_path_obj.get_possible_test_cases('SUITE') == [
+            'first_test']
+
+    def test_empty_file(self):
+        # An empty file has no test suites
+        with tempfile.NamedTemporaryFile(suffix='.yaml') as empty_file:
+            state_path_obj = StatePathsYaml(empty_file.name)
+
+        assert state_path_obj.get_test_suites() == []
 
     def test_get_possible_test_cases(self):
 
@@ -55,18 +128,11 @@ class TestStatePathsYaml:
 
         # Determine expected results
         test_suite_name = "EXAMPLE_2"
-        expected_num_test_cases = 2
-        expected_testcase_names = [
-            f'test_{x + 1}' for x in range(expected_num_test_cases)]
-
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+        expected_num_test_cases = self.NUM_TEST_CASES
+        expected_testcase_names = self.TEST_CASE_NAMES
 
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         test_case_list = state_path_obj.get_possible_test_cases(
             test_suite=test_suite_name)
 
@@ -74,35 +140,28 @@ class TestStatePathsYaml:
         logging.info(f"RETURNED TEST CASES: {test_case_list}")
 
         # Verify right number and names are returned.
-        assert_equals(len(test_case_list), expected_num_test_cases)
+        assert len(test_case_list) == expected_num_test_cases
         for tc_name in test_case_list:
-            assert_in(tc_name, expected_testcase_names)
+            assert tc_name in expected_testcase_names
 
     def test_get_traversal_path_with_correct_params(self):
         # Determine expected results
         test_suite_name = 'EXAMPLE_1'
 
-        num_test_cases = 2
-        test_case_name = 'test_{num}'.format(
-            num=choice([x + 1 for x in range(num_test_cases)]))
+        num_steps_in_test_case = self.NUM_STEPS_IN_TEST_CASE
+        step_names = self.STEP_NAMES
 
-        num_steps_in_test_case = 4
-        step_names = [f"STEP_{x + 1}" for x in range(num_steps_in_test_case)]
+        # Check every test case (deterministic, unlike picking one at random)
+        for test_case_name in self.TEST_CASE_NAMES:
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+            # Execute routine
+            state_path_obj = StatePathsYaml(self.data_file)
+            traversal_path = state_path_obj.get_traversal_path(
+                test_suite=test_suite_name, test_case=test_case_name)
 
-        # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
-        traversal_path = state_path_obj.get_traversal_path(
-            test_suite=test_suite_name, test_case=test_case_name)
-
-        assert_equals(len(traversal_path), num_steps_in_test_case)
-        for trigger in traversal_path:
-            assert_in(trigger, step_names)
+            assert len(traversal_path) == num_steps_in_test_case
+            for trigger in traversal_path:
+                assert trigger in step_names
 
     def test_get_traversal_without_tc_name(self):
         # Determine expected results
@@ -122,109 +181,67 @@ class TestStatePathsYaml:
             ts='ts_does_not_exist', tc='tc_does_not_exist')
 
     def _get_traversal_with_invalid_params(self, ts, tc):
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = StatePathsYaml(self.data_file)
         traversal_path = state_path_obj.get_traversal_path(
             test_suite=ts, test_case=tc)
 
-        assert_equals(len(traversal_path), 0)
+        assert len(traversal_path) == 0
 
     def test_show_file(self):
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         state_path_obj.show_file()
 
     def test_list_test_info_works(self):
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         state_path_obj.list_test_info()
 
     def test_list_test_info_works_with_dne_test_suite(self):
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         state_path_obj.list_test_info(test_suite='imaginary')
 
     def test_list_test_info_works_with_existing_test_suite(self):
-        # Determine data file path
         test_suite = 'EXAMPLE_1'
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
 
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         state_path_obj.list_test_info(test_suite=test_suite)
 
     def test_get_traversal_path_with_test_case_def(self):
         # Determine expected results
         test_suite_name = 'EXAMPLE_1'
 
-        num_test_cases = 2
-        test_case_name = 'test_{num}'.format(
-            num=choice([x + 1 for x in range(num_test_cases)]))
-
-        num_steps_in_test_case = 4
-        step_names = [f"STEP_{x + 1}" for x in range(num_steps_in_test_case)]
+        num_steps_in_test_case = self.NUM_STEPS_IN_TEST_CASE
+        step_names = self.STEP_NAMES
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+        # Check every test case (deterministic, unlike picking one at random)
+        for test_case_name in self.TEST_CASE_NAMES:
 
-        # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
-        tc_def = state_path_obj.build_test_case(
-            test_suite=test_suite_name, test_name=test_case_name)
-        traversal_path = state_path_obj.get_traversal_path(
-            test_case_def=tc_def)
+            # Execute routine
+            state_path_obj = StatePathsYaml(self.data_file)
+            tc_def = state_path_obj.build_test_case(
+                test_suite=test_suite_name, test_name=test_case_name)
+            traversal_path = state_path_obj.get_traversal_path(
+                test_case_def=tc_def)
 
-        assert_equals(len(traversal_path), num_steps_in_test_case)
-        for trigger in traversal_path:
-            assert_in(trigger, step_names)
+            assert len(traversal_path) == num_steps_in_test_case
+            for trigger in traversal_path:
+                assert trigger in step_names
 
     def test_build_test_case_without_params(self):
         # Determine expected results
         test_suite_name = None
         test_case_name = None
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         tc_def = state_path_obj.build_test_case(
             test_suite=test_suite_name, test_name=test_case_name)
 
-        assert_equals(len(tc_def), 0)
+        assert len(tc_def) == 0
 
     @patch(
         'flowtester.state_machine.paths.path_yaml.ValidatePaths.validate_steps',
@@ -234,132 +251,82 @@ class TestStatePathsYaml:
         test_suite_name = "EXAMPLE_1"
         test_case_name = "test_1"
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
-        # Execute routine (with mocked response in build_test_case)
-        state_path_obj = StatePathsYaml(data_file)
+        # Execute routine (with mocked response in build_test_case). The
+        # shallow copy shares the parsed data but records its own test case,
+        # so the file is not parsed again and the shared object is untouched.
+        state_path_obj = copy.copy(self.state_path_obj)
         tc_def = state_path_obj.build_test_case(
             test_suite=test_suite_name, test_name=test_case_name)
 
-        assert_equals(tc_def, [])
+        assert tc_def == []
 
     def test_build_test_case_with_correct_params(self):
         # Determine expected results
         test_suite_name = "EXAMPLE_1"
         test_case_name = "test_1"
-        test_case_steps = 4
-        step_names = [f"STEP_{x + 1}" for x in range(test_case_steps)]
-
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+        test_case_steps = self.NUM_STEPS_IN_TEST_CASE
+        step_names = self.STEP_NAMES
 
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = StatePathsYaml(self.data_file)
         tc_def = state_path_obj.build_test_case(
             test_suite=test_suite_name, test_name=test_case_name)
         tc_step_names = [x.trigger for x in tc_def]
 
-        assert_equals(len(tc_def), test_case_steps)
+        assert len(tc_def) == test_case_steps
         for step in tc_step_names:
-            assert_in(step, step_names)
+            assert step in step_names
 
     def test_get_path_validation_expectations_with_suite_and_case(self):
 
         # Test the StatePathYaml.get_test_validation_expectations() with a
         # valid testcase and testsuite
 
-        expected_test_suite = 'EXAMPLE_1'
-        expected_test_case = 'test_1'
-        num_expectations = 2
-        expectation_ids = [f"expectation_{x + 1}" for x in
-                           range(num_expectations)]
-
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = StatePathsYaml(self.data_file)
         expectations = state_path_obj.get_path_validation_expectations(
-            test_suite=expected_test_suite, test_case=expected_test_case)
+            test_suite=self.EXPECTATIONS_TEST_SUITE,
+            test_case=self.EXPECTATIONS_TEST_CASE)
 
-        # Verify expectations is a non-empty list
-        assert_true(isinstance(expectations, list))
-        assert_not_equals(expectations, [])
-
-        # Verify each entry in the list (dictionary of dictionaries) has the
-        # expected keys and the values are the correct data type (bool)
-        for step in expectations:
-            step_name = list(step.keys())[0]
-            logging.info(f"STEP NAME: {step_name}")
-            expectation_dict = list(step.values())[0]
-
-            # Verify the keys are correct
-            for exp_id in expectation_ids:
-                assert_in(exp_id, list(expectation_dict.keys()),
-                          f"{step_name}: Expected key ({exp_id}) was not found "
-                          f"in the list of defined keys.")
-
-                # Verify the values are booleans
-                for key, exp in list(expectation_dict.items()):
-                    assert_true(isinstance(exp, bool),
-                                f"{step_name}: Expected value {str(exp)} for "
-                                f"{key} was not a boolean")
+        self._verify_expectations(expectations)
 
     def test_get_path_validation_expectations_with_test_def(self):
         # Test the StatePathYaml.get_test_validation_expectations() with a
-        # valid testcase and testsuite
+        # valid test case definition
 
-        expected_test_suite = 'EXAMPLE_1'
-        expected_test_case = 'test_1'
-        num_expectations = 2
-        expectation_ids = [f"expectation_{x + 1}" for x in
-                           range(num_expectations)]
+        # Execute routine
+        expectations = self.state_path_obj.get_path_validation_expectations(
+            test_case_def=self.test_case_def)
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
+        self._verify_expectations(expectations)
 
-        # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
-        test_def = state_path_obj.build_test_case(
-            test_suite=expected_test_suite, test_name=expected_test_case)
-        expectations = state_path_obj.get_path_validation_expectations(
-            test_case_def=test_def)
+    def _verify_expectations(self, expectations: List[dict]) -> NoReturn:
 
         # Verify expectations is a non-empty list
-        assert_true(isinstance(expectations, list))
-        assert_not_equals(expectations, [])
+        assert isinstance(expectations, list)
+        assert expectations != []
 
         # Verify each entry in the list (dictionary of dictionaries) has the
         # expected keys and the values are the correct data type (bool)
+        log_steps = logging.is_enabled_for(Logger.INFO)
         for step in expectations:
-            step_name = list(step.keys())[0]
-            logging.info(f"STEP NAME: {step_name}")
-            expectation_dict = list(step.values())[0]
+            # Each step is a single-key dictionary: {step name: expectations}
+            ((step_name, expectation_dict),) = step.items()
+            if log_steps:
+                logging.info(f"STEP NAME: {step_name}")
 
             # Verify the keys are correct
-            for exp_id in expectation_ids:
-                assert_in(exp_id, list(expectation_dict.keys()),
-                          f"{step_name}: Expected key ({exp_id}) was not found "
-                          f"in the list of defined keys.")
-
-                # Verify the values are booleans
-                for key, exp in list(expectation_dict.items()):
-                    assert_true(isinstance(exp, bool),
-                                f"{step_name}: Expected value {str(exp)} for "
-                                f"{key} was not a boolean")
+            defined_keys = expectation_dict.keys()
+            for exp_id in self.EXPECTATION_IDS:
+                assert exp_id in defined_keys, (
+                    f"{step_name}: Expected key ({exp_id}) was not found "
+                    f"in the list of defined keys.")
+
+            # Verify the values are booleans
+            for key, exp in expectation_dict.items():
+                assert isinstance(exp, bool), (
+                    f"{step_name}: Expected value {str(exp)} for "
+                    f"{key} was not a boolean")
 
     def test_get_path_validation_expectations_with_invalid_suite_and_case(self):
 
@@ -382,17 +349,11 @@ class TestStatePathsYaml:
     def _get_path_validation_fail_path(
             self, ts: str, tc: str) -> NoReturn:
 
-        # Determine data file path
-        data_file = get_data_file(
-            filename=self.SAMPLE_PATH,
-            test_dir_name=self.TEST_DIR_NAME,
-            data_dir_name=self.DATA_DIR_NAME)
-
         # Execute routine
-        state_path_obj = StatePathsYaml(data_file)
+        state_path_obj = self.state_path_obj
         expectations = state_path_obj.get_path_validation_expectations(
             test_suite=ts, test_case=tc)
 
         # Verify expectations is a non-empty list
-        assert_true(isinstance(expectations, list))
-        assert_equals(expectations, [])
+        assert isinstance(expectations, list)
+        assert expectations == []
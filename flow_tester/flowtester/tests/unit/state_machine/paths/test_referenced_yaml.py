@@ -572,6 +572,38 @@ class TestReferentialYaml:
         ids = self._test_add_steps_and_get_ids(tc_step_data=tc_step_data)
         logging.error(f"IDs were returned:\n{', '.join(ids)}")
 
+    def test_add_steps_does_not_alter_add_step_definition(self):
+        added_step_name = 'STEP_1A'
+        added_test_case_id = 'ADDED_1'
+        add_step_def = {
+            YAMLConsts.AFTER_ID: '1',
+            YAMLConsts.ID: added_test_case_id,
+            YAMLConsts.DATA: None,
+            YAMLConsts.EXPECTATIONS: {'test_me': False}
+        }
+        tc_step_data = [{added_step_name: add_step_def}]
+
+        ref_yaml_obj = self._read_and_update_source_yaml_file(
+            filename=self.SIMPLE_REF, testsuite=self.TEST_SUITE,
+            testcase=self.TEST_CASE, element=YAMLConsts.ADD_STEPS,
+            value=tc_step_data)
+        ref_yaml_obj.add_steps()
+
+        tc_data = ReferentialYAML.get_referenced_test_data(
+            yaml_input=ref_yaml_obj.yaml, testsuite=self.TEST_SUITE,
+            testcase=self.TEST_CASE)
+        inserted = [list(x.values())[0] for x in tc_data[YAMLConsts.STEPS]
+                    if list(x.values())[0][YAMLConsts.ID] ==
+                    added_test_case_id][0]
+
+        # The landmark is stripped from the inserted step only; the ADD_STEPS
+        # definition still has it.
+        assert YAMLConsts.AFTER_ID not in inserted
+        assert YAMLConsts.AFTER_ID in add_step_def
+        assert inserted is not add_step_def
+        assert (inserted[YAMLConsts.EXPECTATIONS] ==
+                add_step_def[YAMLConsts.EXPECTATIONS])
+
     # ---------------------------------------------
     # MODIFY: ReferentialYAML.modify_steps()
     # ---------------------------------------------
@@ -602,6 +634,34 @@ class TestReferentialYaml:
         assert_equals.__self__.maxDiff = None
         assert_equals(expected_tc, actual_tc)
 
+    def test_modify_steps_does_not_share_mod_step_definition(self):
+        mod_step_def = {
+            YAMLConsts.ID: 1,
+            YAMLConsts.DATA: {'params': 1, 'value': 7},
+            YAMLConsts.EXPECTATIONS: {'expectations_10': False}
+        }
+        orig_mod_step_def = copy.deepcopy(mod_step_def)
+        tc_step_data = [{"STEP_1": mod_step_def}]
+
+        ref_yaml_obj = self._read_and_update_source_yaml_file(
+            filename=self.SIMPLE_REF, testsuite=self.TEST_SUITE,
+            testcase=self.TEST_CASE, element=YAMLConsts.MOD_STEPS,
+            value=tc_step_data)
+        ref_yaml_obj.modify_steps()
+
+        tc_data = ReferentialYAML.get_referenced_test_data(
+            yaml_input=ref_yaml_obj, testsuite=self.TEST_SUITE,
+            testcase=self.TEST_CASE)
+        modified = [step_def for step in tc_data[YAMLConsts.STEPS]
+                    for step_def in step.values()
+                    if step_def[YAMLConsts.ID] == 1][0]
+
+        # Changing the modified step does not change the MOD_STEPS definition
+        modified[YAMLConsts.ID] = 'changed'
+        modified['new_key'] = 'new_value'
+        assert modified is not mod_step_def
+        assert mod_step_def == orig_mod_step_def
+
     @raises(UndefinedId)
     def test_modify_steps_invalid_step_non_existent_id(self):
         yaml_file = self.SIMPLE_REF
@@ -772,6 +832,70 @@ class TestReferentialYaml:
         assert_equals.__self__.maxDiff = None
         assert_equals(test_yaml_obj.data, ref_yaml_obj.data)
 
+    def test_evaluate_yaml_file_with_shared_reference(self):
+        # Two test cases referencing the same test case: updating the steps
+        # of one test case must not alter the steps of the other.
+        shared_tc = 'test_shared'
+        delete_step_ids = ['3', '4']
+
+        data_file = get_data_file(
+            test_dir_name=self.TESTS_SUBDIR, data_dir_name=self.DATA_SUBDIR,
+            filename=self.SIMPLE_REF)
+        yaml_obj = YamlInputFile(input_file=data_file)
+
+        test_suite = yaml_obj.data[0][self.TEST_SUITE]
+        test_suite[shared_tc] = copy.deepcopy(test_suite[self.TEST_CASE])
+        test_suite[self.TEST_CASE][YAMLConsts.DEL_STEPS] = delete_step_ids
+
+        ref_yaml_obj = ReferentialYAML(yaml_input=yaml_obj)
+        ref_yaml_obj.evaluate_yaml_file()
+
+        updated_ids = self._get_testcase_ids(
+            yaml_data=ref_yaml_obj, test_suite=self.TEST_SUITE,
+            test_case=self.TEST_CASE)
+        shared_ids = self._get_testcase_ids(
+            yaml_data=ref_yaml_obj, test_suite=self.TEST_SUITE,
+            test_case=shared_tc)
+
+        assert set(shared_ids) - set(delete_step_ids) == set(updated_ids)
+        assert len(shared_ids) - len(delete_step_ids) == len(updated_ids)
+
+    def test_evaluate_yaml_file_does_not_share_step_definitions(self):
+        # Two test cases referencing the same test case: changing a step
+        # definition of one test case must not alter the other test case or
+        # the referenced file's data.
+        shared_tc = 'test_shared'
+
+        data_file = get_data_file(
+            test_dir_name=self.TESTS_SUBDIR, data_dir_name=self.DATA_SUBDIR,
+            filename=self.SIMPLE_REF)
+        yaml_obj = YamlInputFile(input_file=data_file)
+
+        test_suite = yaml_obj.data[0][self.TEST_SUITE]
+        test_suite[shared_tc] = copy.deepcopy(test_suite[self.TEST_CASE])
+
+        ref_yaml_obj = ReferentialYAML(yaml_input=yaml_obj)
+        ref_yaml_obj.evaluate_yaml_file()
+
+        ((_, reference_data),) = ref_yaml_obj._ref_file_cache.items()
+        orig_reference_data = copy.deepcopy(reference_data.data)
+        shared_steps = copy.deepcopy(ReferentialYAML.get_referenced_test_data(
+            yaml_input=ref_yaml_obj, testsuite=self.TEST_SUITE,
+            testcase=shared_tc)[YAMLConsts.STEPS])
+
+        # Change every step definition of the first test case
+        tc_data = ReferentialYAML.get_referenced_test_data(
+            yaml_input=ref_yaml_obj, testsuite=self.TEST_SUITE,
+            testcase=self.TEST_CASE)
+        for step in tc_data[YAMLConsts.STEPS]:
+            for step_def in step.values():
+                step_def[YAMLConsts.ID] = 'changed'
+
+        assert ReferentialYAML.get_referenced_test_data(
+            yaml_input=ref_yaml_obj, testsuite=self.TEST_SUITE,
+            testcase=shared_tc)[YAMLConsts.STEPS] == shared_steps
+        assert reference_data.data == orig_reference_data
+
     # ---------------------------------------------
     #        TEST HELPER ROUTINES
     # ---------------------------------------------
@@ -1,5 +1,7 @@
 import copy
 
+from mock import patch
+
 from flowtester.logging.logger import Logger
 from flowtester.state_machine.config.constants \
     import StateMachineConstants as SMConsts
@@ -122,6 +124,20 @@ class TestValidateData:
         # Validate the initial state, should return False
         assert_false(ValidateData(model_def).validate_initial_state())
 
+    def test_validate_transitions_are_looked_up_once_per_state(self):
+        model_file, model_cfg, model_def = setup_state_machine_definitions(
+            self.MACHINE_DEFINITION_FILE)
+        validator = ValidateData(model_def)
+        num_states = len(model_def.get_list_of_states())
+
+        with patch.object(model_def, 'get_transitions',
+                          wraps=model_def.get_transitions) as mocked_trans:
+            assert validator.validate_all_transitions()
+            assert validator.validate_initial_state()
+
+        # The initial state's transitions were cached by the first validation
+        assert mocked_trans.call_count == num_states
+
     def test_validate_multi_trigger_def_with_wildcard(self):
         assert_is_none(
             ValidateData.validate_multi_trigger_defs(
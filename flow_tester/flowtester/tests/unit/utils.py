@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 from typing import List, Pattern, Tuple
@@ -11,6 +12,7 @@ from flowtester.state_machine.engine.engine_definition import MachineDefinition
 logging = Logger()
 
 
+@functools.lru_cache(maxsize=None)
 def get_data_dir(
         test_dir_name: str = 'tests', data_dir_name: str = 'data') -> str:
     """
@@ -48,6 +50,7 @@ def get_data_dir(
     return path
 
 
+@functools.lru_cache(maxsize=None)
 def get_data_file(
         filename: str, test_dir_name: str = 'tests',
         data_dir_name: str = 'data') -> str:
@@ -67,6 +70,7 @@ def get_data_file(
     return os.path.sep.join([data_path, filename])
 
 
+@functools.lru_cache(maxsize=None)
 def get_model_name_from_raw_file(yaml_file: str) -> str:
     """
     Get the model name directly from the YAML file
@@ -147,7 +151,22 @@ def find_all_entries(
              pattern (?P<name>pattern)
 
     Returns:
-        List of pattern matches
+        List of pattern matches (new list per call; safe to modify)
+
+    """
+    return list(_find_all_entries(
+        yaml_file=yaml_file, pattern=pattern, pattern_keyword=pattern_keyword))
+
+
+@functools.lru_cache(maxsize=None)
+def _find_all_entries(
+        yaml_file: str, pattern: Pattern, pattern_keyword: str) -> Tuple[str]:
+    """
+    Cached search of the YAML file (see find_all_entries()): each file is
+    only read and searched once per pattern.
+
+    Returns:
+        Tuple of pattern matches
 
     """
     matches = []
@@ -158,7 +177,7 @@ def find_all_entries(
         match = re.search(pattern, line)
         if match is not None:
             matches.append(match.group(pattern_keyword))
-    return matches
+    return tuple(matches)
 
 
 def setup_state_machine_definitions(
@@ -186,3 +205,21 @@ def setup_state_machine_definitions(
     model_def = MachineDefinition(data=model_cfg.data)
 
     return model_definition_filename, model_cfg, model_def
+
+
+@functools.lru_cache(maxsize=None)
+def get_model_def(def_file: str) -> MachineDefinition:
+    """
+    Load the configuration from file and create a state machine definition.
+    The definition is built once per file and shared by all callers, so it
+    must be treated as read-only.
+
+    Args:
+        def_file (str): NAME (not full path) of the data file
+
+    Returns:
+        MachineDefinition obj.
+
+    """
+    model_cfg = YamlInputFile(input_file=get_data_file(def_file))
+    return MachineDefinition(data=model_cfg.data)